@@ -11,10 +11,24 @@ from typing import Callable
 import click
 
 from gtool.cli.errors import AuthenticationError
+from gtool.config.settings import AVAILABLE_SCOPES, GMAIL_SCOPE_PREFIX
 from gtool.infrastructure.exceptions import AuthError, ConfigValidationError
 
 logger = logging.getLogger(__name__)
 
+# Gmail scope values from AVAILABLE_SCOPES, for constant-time removal when
+# the user toggles Gmail access.
+_GMAIL_SCOPES = frozenset(v for v in AVAILABLE_SCOPES.values() if v.startswith(GMAIL_SCOPE_PREFIX))
+
+# Infrastructure exception -> CLI exception translation table. A single
+# except clause over the key tuple replaces per-type handlers, and %s-style
+# logging defers formatting until the record is actually emitted.
+_TRANSLATE = {
+    ConfigValidationError: click.UsageError,
+    AuthError: AuthenticationError,
+}
+_TRANSLATED_TYPES = tuple(_TRANSLATE)
+
 
 def translate_exceptions(func: Callable) -> Callable:
     """Decorator that translates infrastructure exceptions to CLI exceptions.
@@ -34,12 +48,14 @@ def translate_exceptions(func: Callable) -> Callable:
     def wrapper(*args, **kwargs):
         try:
             return func(*args, **kwargs)
-        except ConfigValidationError as e:
-            logger.debug(f"ConfigValidationError caught: {e}")
-            raise click.UsageError(str(e)) from e
-        except AuthError as e:
-            logger.debug(f"AuthError caught: {e}")
-            raise AuthenticationError(str(e)) from e
+        except _TRANSLATED_TYPES as e:
+            logger.debug("Translating %s: %s", type(e).__name__, e)
+            # Walk the MRO so subclasses of a translated type map correctly.
+            for cls in type(e).__mro__:
+                target = _TRANSLATE.get(cls)
+                if target is not None:
+                    raise target(str(e)) from e
+            raise  # Unreachable: the except tuple matches the table keys.
 
     return wrapper
 
@@ -59,39 +75,46 @@ def prompt_for_config(config: object) -> None:
     """
     click.echo(click.style("Creating a new configuration file...", fg="cyan"))
 
+    # Bind the data dict once and collect all answers locally, applying them
+    # in a single update so config.data changes once rather than per prompt.
+    d = config.data
+    updates = {}
+
     # Credentials and token files
-    config.data["CREDENTIALS_FILE"] = click.prompt(
+    updates["CREDENTIALS_FILE"] = click.prompt(
         "Enter the path to your credentials file",
-        default=config.data.get("CREDENTIALS_FILE", "~/.config/caltool/credentials.json"),
+        default=d.get("CREDENTIALS_FILE", "~/.config/caltool/credentials.json"),
     )
-    config.data["TOKEN_FILE"] = click.prompt(
+    updates["TOKEN_FILE"] = click.prompt(
         "Enter the path to your token file",
-        default=config.data.get("TOKEN_FILE", "~/.config/caltool/token.json"),
+        default=d.get("TOKEN_FILE", "~/.config/caltool/token.json"),
     )
 
     # Time zone
-    config.data["TIME_ZONE"] = click.prompt(
+    updates["TIME_ZONE"] = click.prompt(
         "Enter your time zone",
-        default=config.data.get("TIME_ZONE", "America/Los_Angeles"),
+        default=d.get("TIME_ZONE", "America/Los_Angeles"),
     )
 
     # Availability hours
-    config.data["AVAILABILITY_START"] = click.prompt(
+    updates["AVAILABILITY_START"] = click.prompt(
         "Enter your availability start time (HH:MM)",
-        default=config.data.get("AVAILABILITY_START", "08:00"),
+        default=d.get("AVAILABILITY_START", "08:00"),
     )
-    config.data["AVAILABILITY_END"] = click.prompt(
+    updates["AVAILABILITY_END"] = click.prompt(
         "Enter your availability end time (HH:MM)",
-        default=config.data.get("AVAILABILITY_END", "18:00"),
+        default=d.get("AVAILABILITY_END", "18:00"),
     )
 
     # Calendar IDs
     cal_ids = click.prompt(
         "Enter the comma-separated calendar IDs\n"
         "(You can update this later. The get-calendars command will show your current calendars.)",
-        default=",".join(config.data.get("CALENDAR_IDS", ["primary"])),
+        default=",".join(d.get("CALENDAR_IDS", ["primary"])),
     )
-    config.data["CALENDAR_IDS"] = [cid.strip() for cid in cal_ids.split(",")]
+    updates["CALENDAR_IDS"] = [cid.strip() for cid in cal_ids.split(",")]
+
+    d.update(updates)
 
     # Scope selection
     _prompt_for_scopes(config)
@@ -109,23 +132,25 @@ def _prompt_for_scopes(config: object) -> None:
     Args:
         config: Config object to populate with scopes
     """
-    from gtool.config.settings import AVAILABLE_SCOPES
-
     click.echo(click.style("\nSelect which features to enable:", fg="cyan"))
 
+    # Work on a set so dedup and gmail-scope removal are constant-time
+    # membership ops instead of repeated substring-filter comprehensions.
+    d = config.data
+    scopes = set(d.get("SCOPES", []))
+
     # Calendar scope (always included)
-    current_scopes = set(config.data.get("SCOPES", []))
-    if AVAILABLE_SCOPES["calendar"] not in current_scopes:
-        config.data["SCOPES"] = config.data.get("SCOPES", [])
-        if AVAILABLE_SCOPES["calendar"] not in config.data["SCOPES"]:
-            config.data["SCOPES"].append(AVAILABLE_SCOPES["calendar"])
+    scopes.add(AVAILABLE_SCOPES["calendar"])
 
     # Gmail scope selection
     gmail_enabled = click.confirm(
         "Do you want to enable Gmail access? (Read-only)",
-        default=config.data.get("GMAIL_ENABLED", False),
+        default=d.get("GMAIL_ENABLED", False),
     )
-    config.data["GMAIL_ENABLED"] = gmail_enabled
+    d["GMAIL_ENABLED"] = gmail_enabled
+
+    # Drop any existing Gmail scopes; re-add the selected one below.
+    scopes -= _GMAIL_SCOPES
 
     if gmail_enabled:
         # Ask about write permissions
@@ -134,26 +159,20 @@ def _prompt_for_scopes(config: object) -> None:
             default=False,
         )
 
-        scopes = config.data.get("SCOPES", ["https://www.googleapis.com/auth/calendar"])
         if gmail_modify:
-            scope = AVAILABLE_SCOPES["gmail.modify"]
+            scopes.add(AVAILABLE_SCOPES["gmail.modify"])
         else:
-            scope = AVAILABLE_SCOPES["gmail.readonly"]
+            scopes.add(AVAILABLE_SCOPES["gmail.readonly"])
 
-        # Remove old Gmail scopes if present
-        scopes = [s for s in scopes if "gmail" not in s]
-        scopes.append(scope)
-        config.data["SCOPES"] = scopes
         click.echo(
             click.style(
                 f"  ✓ Gmail enabled with {('read-only' if not gmail_modify else 'read-write')} access",
                 fg="green",
             )
         )
-    else:
-        # Remove Gmail scopes if disabled
-        scopes = config.data.get("SCOPES", ["https://www.googleapis.com/auth/calendar"])
-        config.data["SCOPES"] = [s for s in scopes if "gmail" not in s]
+
+    # Sorted write-back keeps the saved config deterministic.
+    d["SCOPES"] = sorted(scopes)
 
 
 # ============================================================================
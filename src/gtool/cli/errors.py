@@ -39,6 +39,28 @@ class AuthenticationError(CLIError):
         self.message = message
 
 
+# Exception types and message markers that get the auth-specific guidance.
+# Matching on args avoids formatting the exception on the non-auth path.
+_AUTH_TYPES = (AuthenticationError,)
+_AUTH_MARKERS = ("invalid_scope",)
+
+
+def _is_auth_failure(e: CLIError) -> bool:
+    """Check whether an exception should be reported as an auth failure."""
+    if isinstance(e, _AUTH_TYPES):
+        return True
+    # google.auth pulls in heavy crypto dependencies, so only import it on
+    # the error path rather than at CLI startup.
+    try:
+        from google.auth.exceptions import GoogleAuthError
+    except ImportError:
+        pass
+    else:
+        if isinstance(e, GoogleAuthError):
+            return True
+    return any(marker in arg for arg in e.args if isinstance(arg, str) for marker in _AUTH_MARKERS)
+
+
 def handle_cli_exception(e: CLIError) -> None:
     """Handle CLI exceptions with appropriate user-facing error messages.
 
@@ -51,7 +73,7 @@ def handle_cli_exception(e: CLIError) -> None:
     Raises:
         click.Abort: Always raised after displaying error message
     """
-    if isinstance(e, AuthenticationError) or "invalid_scope" in str(e):
+    if _is_auth_failure(e):
         click.echo(
             click.style(
                 "Google authentication failed. Please check your credentials, token, and SCOPES in config.", fg="red"
@@ -2,13 +2,67 @@
 Formatting and color helper functions for gtool CLI output.
 """
 
-from collections import defaultdict
+import functools
+import operator
+import os
+import sys
 
 import click
-from colorama import Fore, Style
-from tabulate import tabulate
 
-from gtool.utils.datetime import format_event_time, get_event_date
+from gtool.utils.datetime import event_start_key, format_event_time, get_event_date
+
+# Color output only when stdout is an actual terminal and the NO_COLOR
+# convention is not set; piped output then stays free of ANSI escapes.
+_COLOR = sys.stdout.isatty() and not os.environ.get("NO_COLOR")
+
+if _COLOR:
+    _c = click.style
+else:
+
+    def _c(text, **_kwargs):
+        """No-op stand-in for click.style when color is disabled."""
+        return text
+
+
+# Precomputed ANSI prefixes for the colors used by format_event, so the hot
+# per-event path concatenates constants instead of re-parsing color names
+# through click.style on every call. With color disabled they are all empty
+# strings, so the same formatting code emits plain text.
+_RESET = "\x1b[0m" if _COLOR else ""
+_ANSI = {
+    (name, bold): click.style("", fg=name, bold=bold).split("\x1b[0m")[0] if _COLOR else ""
+    for name in ("green", "blue", "magenta", "cyan", "yellow", "white")
+    for bold in (False, True)
+}
+
+
+class _NoColorCodes:
+    """Stand-in for colorama's Fore/Style that renders every code empty."""
+
+    def __getattr__(self, name):
+        return ""
+
+
+def _fore_style():
+    """Return (Fore, Style), or empty-string stand-ins when color is off."""
+    if _COLOR:
+        from colorama import Fore, Style
+
+        return Fore, Style
+    codes = _NoColorCodes()
+    return codes, codes
+
+
+def _ansi_prefix(color: str, bold: bool = False) -> str:
+    """Return the ANSI prefix for a color, falling back to click.style for
+    colors outside the precomputed palette."""
+    if not _COLOR:
+        return ""
+    prefix = _ANSI.get((color, bold))
+    if prefix is None:
+        prefix = click.style("", fg=color, bold=bold).split(_RESET)[0]
+    return prefix
+
 
 # Column width constants for Gmail list table formatting
 SUBJECT_MAX_LENGTH = 50
@@ -16,44 +70,81 @@ SNIPPET_MAX_LENGTH = 60
 SUBJECT_TRUNCATE_DEFAULT = 80
 
 
+def _render_grid(headers: list, rows: list, row_colors: list) -> str:
+    """Render a grid-style table, adding ANSI colors after padding.
+
+    Column widths are measured on the raw (uncolored) cell strings, so the
+    zero-width ANSI escapes never skew the padding math. This avoids
+    tabulate's per-cell wcwidth scanning of escape-laden strings, which
+    dominates formatting cost for medium result sets.
+
+    Args:
+        headers: Column header strings (uncolored).
+        rows: List of rows; each row is a list of uncolored cell strings.
+        row_colors: One color prefix (e.g. Fore.GREEN) per column.
+
+    Returns:
+        Formatted table string ready to print.
+    """
+    Fore, Style = _fore_style()
+
+    widths = [len(h) for h in headers]
+    for row in rows:
+        for i, cell in enumerate(row):
+            if len(cell) > widths[i]:
+                widths[i] = len(cell)
+
+    border = "+" + "+".join("-" * (w + 2) for w in widths) + "+"
+    header_sep = "+" + "+".join("=" * (w + 2) for w in widths) + "+"
+
+    lines = [border]
+    lines.append("| " + " | ".join(f"{Fore.CYAN}{h:<{w}}{Style.RESET_ALL}" for h, w in zip(headers, widths)) + " |")
+    lines.append(header_sep)
+    for row in rows:
+        lines.append(
+            "| " + " | ".join(f"{c}{cell:<{w}}{Style.RESET_ALL}" for c, cell, w in zip(row_colors, row, widths)) + " |"
+        )
+        lines.append(border)
+    return "\n".join(lines)
+
+
 def format_slots_table(free_slots: list) -> str:
     """Return a formatted table of free slots as a string."""
-    table_data = []
-    for s, e in free_slots:
-        s_formatted = s.strftime("%a %m/%d %I:%M %p")
-        e_formatted = e.strftime("%I:%M %p")
-        table_data.append(
-            [
-                Fore.GREEN + s_formatted + Style.RESET_ALL,
-                Fore.GREEN + e_formatted + Style.RESET_ALL,
-                Fore.YELLOW + f"{(e - s).seconds // 60} min" + Style.RESET_ALL,
-            ]
-        )
-    return tabulate(
-        table_data,
-        headers=[
-            Fore.CYAN + "Start Time" + Style.RESET_ALL,
-            Fore.CYAN + "End Time" + Style.RESET_ALL,
-            Fore.CYAN + "Total Time" + Style.RESET_ALL,
-        ],
-        tablefmt="grid",
+    Fore, _ = _fore_style()
+
+    # total_seconds() is correct for deltas over 24h, unlike .seconds.
+    rows = [
+        [f"{s:%a %m/%d %I:%M %p}", f"{e:%I:%M %p}", f"{int((e - s).total_seconds()) // 60} min"] for s, e in free_slots
+    ]
+    return _render_grid(
+        headers=["Start Time", "End Time", "Total Time"],
+        rows=rows,
+        row_colors=[Fore.GREEN, Fore.GREEN, Fore.YELLOW],
     )
 
 
 def pretty_print_slots(free_slots: list):
     """Pretty print the free slots."""
+    Fore, Style = _fore_style()
+
     print(Fore.CYAN + "Available Time Slots:" + Style.RESET_ALL)
     print(Fore.YELLOW + "=" * 50 + Style.RESET_ALL)
     print(format_slots_table(free_slots))
     print(Fore.YELLOW + "=" * 50 + Style.RESET_ALL)
 
 
-def get_calendar_colors(calendar_ids):
-    """Assign a color to each calendar id."""
+@functools.lru_cache(maxsize=8)
+def _calendar_colors(calendar_ids: tuple) -> dict:
+    """Build the color assignment for a tuple of calendar ids."""
     available_colors = ["green", "blue", "magenta", "cyan", "yellow"]
     return {cid: available_colors[i % len(available_colors)] for i, cid in enumerate(calendar_ids)}
 
 
+def get_calendar_colors(calendar_ids):
+    """Assign a color to each calendar id."""
+    return _calendar_colors(tuple(calendar_ids))
+
+
 def format_event(event, calendar_colors, config, calendar_names=None):
     """
     Return a list of formatted lines for a single event.
@@ -75,12 +166,12 @@ def format_event(event, calendar_colors, config, calendar_names=None):
         calendar_name = event.get("organizer", {}).get("displayName", "Private")
 
     summary += f" ({calendar_name})"
-    lines = [f"• {click.style(summary, fg=calendar_color, bold=True)}"]
+    lines = [f"• {_ansi_prefix(calendar_color, bold=True)}{summary}{_RESET}"]
     if event.get("location"):
-        lines.append(f"    {click.style('location: ' + event['location'], fg='blue')}")
+        lines.append(f"    {_ANSI[('blue', False)]}location: {event['location']}{_RESET}")
     # Always show formatted event time with duration
     event_time_str = format_event_time(event, config)
-    lines.append(f"    {click.style(event_time_str, fg='yellow')}")
+    lines.append(f"    {_ANSI[('yellow', False)]}{event_time_str}{_RESET}")
     lines.append("")  # Blank line between events
     return lines
 
@@ -95,48 +186,66 @@ def format_calendars_table(calendars: list) -> str:
     Returns:
         Formatted table string ready to print
     """
-    table_data = [
+    Fore, _ = _fore_style()
+
+    rows = [
         [
-            Fore.GREEN + calendar["summary"] + Style.RESET_ALL,
-            Fore.BLUE + calendar["id"] + Style.RESET_ALL,
-            Fore.YELLOW + calendar.get("accessRole", "unknown") + Style.RESET_ALL,
+            calendar["summary"],
+            calendar["id"],
+            calendar.get("accessRole", "unknown"),
         ]
         for calendar in calendars
     ]
-    return tabulate(
-        table_data,
-        headers=[
-            Fore.CYAN + "Calendar Name" + Style.RESET_ALL,
-            Fore.CYAN + "Calendar ID" + Style.RESET_ALL,
-            Fore.CYAN + "Access Role" + Style.RESET_ALL,
-        ],
-        tablefmt="grid",
+    return _render_grid(
+        headers=["Calendar Name", "Calendar ID", "Access Role"],
+        rows=rows,
+        row_colors=[Fore.GREEN, Fore.BLUE, Fore.YELLOW],
     )
 
 
+def print_events_sorted(decorated, calendar_colors, calendar_names, timezone):
+    """
+    Print pre-sorted, decorated events, emitting a header on each new date.
+
+    Expects `decorated` to be a list of (sort_key, date_str, event) tuples
+    already sorted by start time, so grouping is a single linear walk with
+    no intermediate dict and no recomputation of each event's date.
+
+    Args:
+        decorated: Sorted list of (sort_key, date_str, event) tuples
+        calendar_colors: Dict mapping calendar IDs to color names
+        calendar_names: Dict mapping calendar IDs to calendar names
+        timezone: Timezone string for formatting
+    """
+    # Accumulate everything and write once: one syscall instead of several
+    # per event, which dominates wall time for long listings.
+    out = []
+    current_date = None
+    for _, date_str, event in decorated:
+        if date_str != current_date:
+            out.append(_c(f"Events for {date_str}", fg="cyan"))
+            current_date = date_str
+        out.extend(format_event(event, calendar_colors, timezone, calendar_names))
+    if out:
+        click.echo("\n".join(out))
+
+
 def print_events_grouped_by_date(events, calendar_colors, calendar_names, timezone):
     """
     Print events grouped by date with formatted output.
 
+    Convenience wrapper around print_events_sorted for callers holding a
+    plain (unsorted) event list.
+
     Args:
         events: List of event dicts from Google Calendar API
         calendar_colors: Dict mapping calendar IDs to color names
         calendar_names: Dict mapping calendar IDs to calendar names
         timezone: Timezone string for formatting
     """
-    # Group events by date
-    grouped = defaultdict(list)
-    for event in events:
-        date_str = get_event_date(event)
-        grouped[date_str].append(event)
-
-    # Print events for each date
-    for date, day_events in grouped.items():
-        click.echo(click.style(f"Events for {date}", fg="cyan"))
-        for event in day_events:
-            lines = format_event(event, calendar_colors, timezone, calendar_names)
-            for line in lines:
-                click.echo(line)
+    decorated = [(event_start_key(e), get_event_date(e), e) for e in events]
+    decorated.sort(key=operator.itemgetter(0))
+    print_events_sorted(decorated, calendar_colors, calendar_names, timezone)
 
 
 # ============================================================================
@@ -188,8 +297,12 @@ def format_gmail_list_table(messages: list, include_subject: bool = True) -> str
         >>> print(table)
         # Outputs colored table with ID, Subject, Preview columns
     """
+    from tabulate import tabulate
+
+    Fore, Style = _fore_style()
+
     if not messages:
-        return click.style("No messages found.", fg="yellow")
+        return _c("No messages found.", fg="yellow")
 
     table_data = []
     for i, msg in enumerate(messages, 1):
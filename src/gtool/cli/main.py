@@ -1,8 +1,15 @@
+from __future__ import annotations
+
+import functools
+import heapq
 import json
 import logging
+import os
+import sys
+import time
+from typing import TYPE_CHECKING
 
 import click
-from colorama import Fore, Style
 
 from gtool.cli.decorators import (
     prompt_for_config,
@@ -10,23 +17,20 @@ from gtool.cli.decorators import (
     validate_count_param,
 )
 from gtool.cli.errors import CLIError, handle_cli_exception
-from gtool.cli.formatters import (
-    format_calendars_table,
-    format_gmail_list_table,
-    get_calendar_colors,
-    pretty_print_slots,
-    print_events_grouped_by_date,
-)
-from gtool.clients.calendar import CalendarClient
-from gtool.clients.gmail import GmailClient
 from gtool.config.settings import Config
-from gtool.core.models import SearchParameters
-from gtool.core.scheduler import Scheduler
-from gtool.infrastructure.auth import GoogleAuth
 from gtool.infrastructure.exceptions import AuthError, ConfigValidationError
-from gtool.infrastructure.retry import RetryPolicy
-from gtool.infrastructure.service_factory import ServiceFactory
-from gtool.utils.datetime import parse_date_range, parse_time_option
+from gtool.utils.datetime import event_start_key, get_event_date, parse_date_range, parse_time_option
+
+if TYPE_CHECKING:
+    from gtool.clients.calendar import CalendarClient
+    from gtool.clients.gmail import GmailClient
+    from gtool.infrastructure.retry import RetryPolicy
+    from gtool.infrastructure.service_factory import ServiceFactory
+
+# The Google client stack (googleapiclient, google.auth, crypto backends)
+# dominates cold-start time, so everything that pulls it in is imported
+# inside the commands that actually talk to the API. Lightweight
+# subcommands like `gtool config` and `--help` never load it.
 
 logging.basicConfig(
     level=logging.ERROR,
@@ -38,21 +42,81 @@ logger = logging.getLogger(__name__)
 
 # --- Client Factory Functions ---
 def _create_client_dependencies(config: Config) -> tuple[ServiceFactory, RetryPolicy]:
-    """Create shared dependencies for API clients."""
-    auth = GoogleAuth(config)
-    service_factory = ServiceFactory(auth=auth)
-    retry_policy = RetryPolicy(max_retries=3, delay=2.0)
-    return service_factory, retry_policy
+    """Create shared dependencies for API clients.
+
+    The dependencies are cached on the Config instance so commands that
+    build several clients (or both Calendar and Gmail) only construct
+    GoogleAuth/ServiceFactory/RetryPolicy once per invocation.
+    """
+    deps = getattr(config, "_client_deps", None)
+    if deps is None:
+        from gtool.infrastructure.auth import GoogleAuth
+        from gtool.infrastructure.retry import get_retry_policy
+        from gtool.infrastructure.service_factory import ServiceFactory
+
+        auth = GoogleAuth(config)
+        service_factory = ServiceFactory(auth=auth)
+        retry_policy = get_retry_policy(max_retries=3, delay=2.0)
+        deps = (service_factory, retry_policy)
+        config._client_deps = deps
+    return deps
+
+
+# Calendar list changes rarely; cache it on disk next to the config file
+# so show-events doesn't pay a network round-trip per invocation.
+CALENDAR_LIST_CACHE_TTL = 3600
+
+
+def _calendar_list_cache_path(config: Config) -> str:
+    """Return the path of the on-disk calendar list cache."""
+    return os.path.join(os.path.dirname(config.path), "calendars.json")
+
+
+def get_calendar_list_cached(client: CalendarClient, config: Config, ttl: int = CALENDAR_LIST_CACHE_TTL) -> list:
+    """Return the calendar list, served from an on-disk cache when fresh.
+
+    On a cache miss (missing, stale, or unreadable file), fetches from the
+    API and atomically rewrites the cache file.
+    """
+    cache_path = _calendar_list_cache_path(config)
+    try:
+        if time.time() - os.path.getmtime(cache_path) < ttl:
+            with open(cache_path) as f:
+                return json.load(f)
+    except (OSError, ValueError):
+        pass
+
+    calendars = client.get_calendar_list()
+    try:
+        tmp_path = cache_path + ".tmp"
+        with open(tmp_path, "w") as f:
+            json.dump(calendars, f)
+        os.replace(tmp_path, cache_path)
+    except OSError as e:
+        logger.debug("Could not write calendar list cache: %s", e)
+    return calendars
+
+
+def invalidate_calendar_list_cache(config: Config) -> None:
+    """Drop the on-disk calendar list cache, if present."""
+    try:
+        os.remove(_calendar_list_cache_path(config))
+    except OSError:
+        pass
 
 
 def create_calendar_client(config: Config) -> CalendarClient:
     """Create a composed Calendar client with retry policy."""
+    from gtool.clients.calendar import CalendarClient
+
     service_factory, retry_policy = _create_client_dependencies(config)
     return CalendarClient(service_factory=service_factory, retry_policy=retry_policy)
 
 
 def create_gmail_client(config: Config) -> GmailClient:
     """Create a composed Gmail client with retry policy."""
+    from gtool.clients.gmail import GmailClient
+
     service_factory, retry_policy = _create_client_dependencies(config)
     return GmailClient(service_factory=service_factory, retry_policy=retry_policy)
 
@@ -112,6 +176,10 @@ def free(config, date_range, duration, availability_start, availability_end, tim
     if avail_start >= avail_end:
         raise click.UsageError(f"Availability start time ({avail_start_str}) must be before end time ({avail_end_str})")
 
+    from gtool.cli.formatters import pretty_print_slots
+    from gtool.core.models import SearchParameters
+    from gtool.core.scheduler import Scheduler
+
     try:
         client = create_calendar_client(config)
         search_params = SearchParameters(
@@ -130,10 +198,10 @@ def free(config, date_range, duration, availability_start, availability_end, tim
         if pretty:
             pretty_print_slots(free_slots)
         else:
-            for s, e in free_slots:
-                s_formatted = s.strftime("%a %m/%d %I:%M %p")
-                e_formatted = e.strftime("%I:%M %p")
-                print(f"{s_formatted} - {e_formatted}")
+            # One buffered write for the whole listing instead of a print
+            # (and flush) per slot.
+            sys.stdout.write("".join(f"{s:%a %m/%d %I:%M %p} - {e:%I:%M %p}\n" for s, e in free_slots))
+            sys.stdout.flush()
     except CLIError as e:
         handle_cli_exception(e)
 
@@ -141,11 +209,15 @@ def free(config, date_range, duration, availability_start, availability_end, tim
 @cli.command(help="List all available calendars.")
 @click.pass_obj
 def get_calendars(config):
+    from gtool.cli.formatters import format_calendars_table
+
     try:
         client = create_calendar_client(config)
         calendars = client.get_calendar_list()
-        print(Fore.CYAN + "Available Calendars:" + Style.RESET_ALL)
-        print(format_calendars_table(calendars))
+        # The user asked for a fresh listing, so drop the cached copy.
+        invalidate_calendar_list_cache(config)
+        click.echo(click.style("Available Calendars:", fg="cyan"))
+        click.echo(format_calendars_table(calendars))
     except CLIError as e:
         handle_cli_exception(e)
 
@@ -161,23 +233,37 @@ def show_events(config, date_range):
         date_range = "today"
     start_datetime, end_datetime = parse_date_range(date_range, tz)
 
+    from concurrent.futures import ThreadPoolExecutor
+
+    from gtool.cli.formatters import get_calendar_colors, print_events_sorted
+
     try:
         client = create_calendar_client(config)
         calendar_ids = config.get("CALENDAR_IDS")
 
         # Build calendar_id -> summary mapping
-        calendar_list = client.get_calendar_list()
+        calendar_list = get_calendar_list_cached(client, config)
         calendar_names = {cal["id"]: cal["summary"] for cal in calendar_list}
 
-        # Fetch and sort events
-        events = []
-        for calendar_id in calendar_ids:
-            events.extend(client.get_events(calendar_id, start_time=start_datetime, end_time=end_datetime))
-        events.sort(key=lambda e: e["start"].get("dateTime", e["start"].get("date")))
+        # Fetch per-calendar event lists; each one arrives already sorted by
+        # start time (orderBy=startTime in get_events), so an O(n log k) heap
+        # merge replaces the global O(n log n) sort. The fetches are
+        # independent I/O-bound HTTPS calls, so overlap them across threads
+        # when there is more than one calendar.
+        fetch = functools.partial(client.get_events, start_time=start_datetime, end_time=end_datetime)
+        if len(calendar_ids) > 1:
+            # Drain each generator inside its worker thread so the page
+            # fetches actually overlap.
+            with ThreadPoolExecutor(max_workers=min(8, len(calendar_ids))) as ex:
+                streams = list(ex.map(lambda cid: list(fetch(cid)), calendar_ids))
+        else:
+            # Single calendar: stream pages straight into the merge.
+            streams = [fetch(calendar_id) for calendar_id in calendar_ids]
+        decorated = [(event_start_key(e), get_event_date(e), e) for e in heapq.merge(*streams, key=event_start_key)]
 
         # Display events grouped by date
         calendar_colors = get_calendar_colors(calendar_ids)
-        print_events_grouped_by_date(events, calendar_colors, calendar_names, tz)
+        print_events_sorted(decorated, calendar_colors, calendar_names, tz)
     except CLIError as e:
         handle_cli_exception(e)
 
@@ -270,8 +356,13 @@ def gmail_list(config, query, label_filter, count, format_):
     # Handle count parameter with validation
     actual_count = validate_count_param(count)
 
+    from gtool.cli.formatters import format_gmail_list_table
+
     client = create_gmail_client(config)
-    # Pass label parameter to list_messages
+    # Pass label parameter to list_messages. Both output formats need the
+    # per-message metadata: the table shows subjects and the simple format
+    # shows snippet previews, neither of which messages.list returns under
+    # the id-only field mask.
     messages = client.list_messages(query=query, label=label_filter, limit=actual_count)
 
     if not messages:
@@ -284,16 +375,18 @@ def gmail_list(config, query, label_filter, count, format_):
         table = format_gmail_list_table(messages, include_subject=True)
         click.echo(table)
     else:
-        # Legacy simple format for backward compatibility
-        click.echo(click.style(f"\nFound {len(messages)} message(s):", fg="cyan"))
+        # Legacy simple format for backward compatibility; buffer all lines
+        # and emit them in a single write.
+        out = [click.style(f"\nFound {len(messages)} message(s):", fg="cyan")]
         for i, msg in enumerate(messages, 1):
             msg_id = msg.get("id", "N/A")
             snippet = msg.get("snippet", "(no preview)")
             thread_id = msg.get("threadId", "N/A")
-            click.echo(f"{i}. ID: {msg_id}")
-            click.echo(f"   Thread: {thread_id}")
-            click.echo(f"   Preview: {snippet[:80]}...")
-            click.echo("")
+            out.append(f"{i}. ID: {msg_id}")
+            out.append(f"   Thread: {thread_id}")
+            out.append(f"   Preview: {snippet[:80]}...")
+            out.append("")
+        click.echo("\n".join(out))
 
 
 @gmail.command(
@@ -312,10 +405,15 @@ def gmail_list(config, query, label_filter, count, format_):
 def gmail_show_message(config, message_id, format_):
     """Show details of a specific Gmail message."""
     client = create_gmail_client(config)
-    message = client.get_message(message_id=message_id)
+    # Pass the requested format through so e.g. --format metadata skips
+    # transferring the (potentially multi-MB) message body entirely.
+    message = client.get_message(message_id=message_id, format_=format_)
 
     click.echo(click.style(f"\nMessage ID: {message_id}", fg="cyan"))
-    click.echo(json.dumps(message, indent=2))
+    # Stream straight to stdout instead of materializing the whole
+    # pretty-printed payload as one string first.
+    json.dump(message, sys.stdout, indent=2)
+    click.echo()
 
 
 @gmail.command("delete", help="Delete a Gmail message. Example: gtool gmail delete <message_id>")
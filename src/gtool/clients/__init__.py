@@ -1,9 +1,22 @@
-"""Clients layer - Google API client implementations."""
+"""Clients layer - Google API client implementations.
 
-from gtool.clients.calendar import CalendarClient
-from gtool.clients.gmail import GmailClient
+The client classes are exposed lazily (PEP 562) so importing the package
+does not pull in googleapiclient until a client is actually used.
+"""
 
 __all__ = [
     "CalendarClient",
     "GmailClient",
 ]
+
+
+def __getattr__(name):
+    if name == "CalendarClient":
+        from gtool.clients.calendar import CalendarClient
+
+        return CalendarClient
+    if name == "GmailClient":
+        from gtool.clients.gmail import GmailClient
+
+        return GmailClient
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
@@ -9,6 +9,10 @@ from typing import Any, List, Optional
 from gtool.infrastructure.retry import RetryPolicy
 from gtool.infrastructure.service_factory import ServiceFactory
 
+# The Gmail API rejects batch requests carrying more than this many
+# sub-requests, so metadata fetches are chunked to stay under it.
+GMAIL_BATCH_LIMIT = 100
+
 
 def extract_subject_from_headers(message: dict) -> str:
     """Extract subject line from Gmail message headers.
@@ -48,17 +52,15 @@ def extract_subject_from_headers(message: dict) -> str:
         '(No Subject)'
     """
     # Get headers from message payload
-    headers = message.get("payload", {}).get("headers", [])
+    headers = message.get("payload", {}).get("headers", ())
 
-    # Find Subject header
-    for header in headers:
-        if header.get("name", "").lower() == "subject":
-            subject = header.get("value", "").strip()
-            # Return "(No Subject)" if blank (FR-006)
-            return subject if subject else "(No Subject)"
+    # Build a lowercased name -> value map in one C-level comprehension
+    # instead of a Python-level scan with per-header lower()/get() calls;
+    # last-write-wins on duplicate headers is fine.
+    header_map = {h["name"].lower(): h.get("value", "") for h in headers if "name" in h}
 
-    # No Subject header found
-    return "(No Subject)"
+    # Return "(No Subject)" if missing or blank (FR-006)
+    return header_map.get("subject", "").strip() or "(No Subject)"
 
 
 class GmailClient:
@@ -100,7 +102,26 @@ class GmailClient:
         if self._service is None and self._service_factory is not None:
             self._service = self._service_factory.build_service("gmail", "v1")
 
-    def list_messages(self, query: str = "", label: Optional[str] = None, limit: int = 10) -> List[dict]:
+    def _call_with_retry(self, func: Any, *args: Any, retryable: bool = True, **kwargs: Any) -> Any:
+        """Invoke func through the retry policy when one is configured.
+
+        Args:
+            func: Callable performing the API request.
+            *args: Positional arguments passed through to func.
+            retryable: When False, the call is made exactly once even with a
+                retry policy configured (for non-idempotent operations).
+            **kwargs: Keyword arguments passed through to func.
+
+        Returns:
+            Result of func execution.
+        """
+        if self._retry_policy is not None:
+            return self._retry_policy.execute(func, *args, retryable=retryable, **kwargs)
+        return func(*args, **kwargs)
+
+    def list_messages(
+        self, query: str = "", label: Optional[str] = None, limit: int = 10, fetch_headers: bool = True
+    ) -> List[dict]:
         """List Gmail messages matching a query with optional label filtering.
 
         Returns a list of message metadata matching the specified query and/or label.
@@ -122,15 +143,17 @@ class GmailClient:
             no parameters → "label:INBOX"
 
         Note:
-            This method makes N+1 API calls (1 list + N get calls) to fetch message
-            headers including subjects. This is acceptable for small limits (default 10)
-            but may be slow for large result sets. Consider using Gmail's batch API
-            for bulk operations in the future.
+            Message headers (subjects) are fetched through batched HTTP
+            requests of at most GMAIL_BATCH_LIMIT sub-requests each, so
+            listing costs 1 + ceil(n / 100) round-trips for n messages.
 
         Args:
             query: Gmail search query (default: "").
             label: Single label filter (default: None). Converted to label:X syntax.
             limit: Maximum number of messages to return.
+            fetch_headers: Whether to fetch per-message metadata (subject,
+                snippet). Pass False when the caller only needs ids, which
+                skips the metadata round-trip entirely.
 
         Returns:
             List of message dictionaries with id, threadId, snippet, and subject.
@@ -150,51 +173,68 @@ class GmailClient:
         # T016, T017 [US2]: Build query with label filtering
         final_query = self._build_query_with_label(query, label)
 
-        def fetch_messages():
-            return self._service.users().messages().list(userId="me", q=final_query, maxResults=limit).execute()
-
-        if self._retry_policy is not None:
-            result = self._retry_policy.execute(fetch_messages)
-        else:
-            result = fetch_messages()
+        request = (
+            self._service.users()
+            .messages()
+            .list(userId="me", q=final_query, maxResults=limit, fields="messages(id,threadId),resultSizeEstimate")
+        )
+        result = self._call_with_retry(request.execute)
 
         messages = result.get("messages", [])
+        if not messages:
+            return []
+
+        # Fast path: callers that render only ids don't need the metadata
+        # round-trip at all.
+        if not fetch_headers:
+            return messages
+
+        # Enrich messages with subject lines (T006 [US1]). All metadata
+        # fetches go out in one BatchHttpRequest instead of N sequential
+        # round-trips, collapsing per-message latency into a single call.
+        metadata: dict = {}
+
+        def store_response(request_id, response, exception):
+            if exception is None and response is not None:
+                metadata[request_id] = response
+
+        # Gmail rejects batches with more than GMAIL_BATCH_LIMIT
+        # sub-requests, so large limits are split into successive batches.
+        msg_ids = [msg["id"] for msg in messages if msg.get("id")]
+        for chunk_start in range(0, len(msg_ids), GMAIL_BATCH_LIMIT):
+            batch = self._service.new_batch_http_request()
+            for msg_id in msg_ids[chunk_start : chunk_start + GMAIL_BATCH_LIMIT]:
+                batch.add(
+                    self._service.users()
+                    .messages()
+                    .get(
+                        userId="me",
+                        id=msg_id,
+                        format="metadata",
+                        metadataHeaders=["Subject", "From", "Date"],
+                        fields="id,snippet,payload/headers",
+                    ),
+                    request_id=msg_id,
+                    callback=store_response,
+                )
+            self._call_with_retry(batch.execute)
 
-        # Enrich messages with subject lines (T006 [US1])
-        # Note: This makes N additional API calls. See docstring for trade-off discussion.
         enriched_messages = []
         for msg in messages:
-            msg_id = msg.get("id")
-            if msg_id:
-                # Fetch message with metadata format to get headers
-                # Use default argument to capture msg_id by value, not reference
-                def fetch_full_message(message_id=msg_id):
-                    return (
-                        self._service.users()
-                        .messages()
-                        .get(userId="me", id=message_id, format="metadata", metadataHeaders=["Subject", "From", "Date"])
-                        .execute()
-                    )
-
-                if self._retry_policy is not None:
-                    full_msg = self._retry_policy.execute(fetch_full_message)
-                else:
-                    full_msg = fetch_full_message()
-
-                # Extract subject from headers
-                subject = extract_subject_from_headers(full_msg)
-
-                # Merge subject into message dict
-                enriched_msg = {**msg, "subject": subject}
-
-                # Also include snippet if available from full message
-                if "snippet" in full_msg:
-                    enriched_msg["snippet"] = full_msg["snippet"]
-
-                enriched_messages.append(enriched_msg)
-            else:
-                # Fallback if message has no ID
+            full_msg = metadata.get(msg.get("id"))
+            if full_msg is None:
+                # Fallback if the message had no ID or its sub-request failed
                 enriched_messages.append({**msg, "subject": "(No Subject)"})
+                continue
+
+            # Merge subject into message dict
+            enriched_msg = {**msg, "subject": extract_subject_from_headers(full_msg)}
+
+            # Also include snippet if available from full message
+            if "snippet" in full_msg:
+                enriched_msg["snippet"] = full_msg["snippet"]
+
+            enriched_messages.append(enriched_msg)
 
         return enriched_messages
 
@@ -248,12 +288,8 @@ class GmailClient:
             CLIError: If Gmail scope missing, message not found, or API call fails.
         """
 
-        def fetch_message():
-            return self._service.users().messages().get(userId="me", id=message_id, format=format_).execute()
-
-        if self._retry_policy is not None:
-            return self._retry_policy.execute(fetch_message)
-        return fetch_message()
+        request = self._service.users().messages().get(userId="me", id=message_id, format=format_)
+        return self._call_with_retry(request.execute)
 
     def delete_message(self, message_id: str) -> None:
         """Delete a message permanently.
@@ -268,11 +304,8 @@ class GmailClient:
             CLIError: If Gmail scope missing, message not found, or API call fails.
         """
 
-        def delete_msg():
-            self._service.users().messages().delete(userId="me", id=message_id).execute()
-
-        if self._retry_policy is not None:
-            self._retry_policy.execute(delete_msg)
-        else:
-            delete_msg()
+        # Deletes are not replayed: a 500 after the server already removed
+        # the message would otherwise retry into a confusing 404.
+        request = self._service.users().messages().delete(userId="me", id=message_id)
+        self._call_with_retry(request.execute, retryable=False)
         return None
@@ -1,6 +1,8 @@
-"""Configuration layer - settings and environment management."""
+"""Configuration layer - settings and environment management.
 
-from gtool.config.settings import AVAILABLE_SCOPES, CONFIG_PATH, DEFAULTS, Config
+Exports are resolved lazily (PEP 562) so touching the package does not
+load the settings module (and platformdirs) until something needs it.
+"""
 
 __all__ = [
     "Config",
@@ -8,3 +10,11 @@ __all__ = [
     "AVAILABLE_SCOPES",
     "CONFIG_PATH",
 ]
+
+
+def __getattr__(name):
+    if name in __all__:
+        from gtool.config import settings
+
+        return getattr(settings, name)
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
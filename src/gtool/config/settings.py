@@ -1,16 +1,35 @@
+import functools
 import json
 import logging
 import os
 
-from platformdirs import user_config_dir
-
 from gtool.infrastructure.exceptions import ConfigValidationError
 
 logger = logging.getLogger("gtool")
 
 APP_NAME = "caltool"  # Keep original name for backward compat with existing config files
 CONFIG_FILENAME = "config.json"
-CONFIG_PATH = os.path.join(user_config_dir(APP_NAME), CONFIG_FILENAME)
+
+
+@functools.cache
+def get_config_path() -> str:
+    """Return the default config file path, computed once on first use.
+
+    platformdirs is imported here rather than at module scope so its
+    env/stat probing stays off the import path of commands that never
+    touch the config file.
+    """
+    from platformdirs import user_config_dir
+
+    return os.path.join(user_config_dir(APP_NAME), CONFIG_FILENAME)
+
+
+def __getattr__(name):
+    # Backward-compatible module attribute for older importers.
+    if name == "CONFIG_PATH":
+        return get_config_path()
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
 
 DEFAULTS = {
     "CREDENTIALS_FILE": "~/.config/caltool/credentials.json",
@@ -34,6 +53,17 @@ AVAILABLE_SCOPES = {
     "gmail.modify": "https://www.googleapis.com/auth/gmail.modify",
 }
 
+# Common prefix of all Gmail scope URLs, for cheap startswith checks.
+GMAIL_SCOPE_PREFIX = "https://www.googleapis.com/auth/gmail"
+
+# The known Gmail scopes as a frozenset, for exact O(1) membership tests.
+GMAIL_SCOPES = frozenset({AVAILABLE_SCOPES["gmail.readonly"], AVAILABLE_SCOPES["gmail.modify"]})
+
+# Parsed-config cache keyed on path, stamped with (mtime_ns, size) so any
+# on-disk change invalidates it. Each Config() in the same process then
+# skips the JSON parse unless the file actually changed.
+_CONFIG_CACHE = {}
+
 
 class Config:
     def validate(self):
@@ -46,57 +76,151 @@ class Config:
             "AVAILABILITY_START",
             "AVAILABILITY_END",
         ]
-        logger.debug(f"Validating config: {self.data}")
+        if self._validated_for is not None and self._validated_for == self._file_stamp():
+            logger.debug("Config unchanged since last validation, skipping.")
+            return
+        logger.debug("Validating config: %s", self.data)
         missing = [k for k in required_keys if not self.get(k)]
         if missing:
-            logger.error(f"Missing required config keys: {missing}")
+            logger.error("Missing required config keys: %s", missing)
             raise ConfigValidationError(
                 f"Missing required config keys: {', '.join(missing)}. Run 'gtool config' to set up."
             )
         # Basic format validation
         if not isinstance(self.get("SCOPES"), list):
-            logger.error(f"SCOPES must be a list, got {type(self.get('SCOPES'))}")
+            logger.error("SCOPES must be a list, got %s", type(self.get("SCOPES")))
             raise ConfigValidationError("SCOPES must be a list.")
         if not isinstance(self.get("CALENDAR_IDS"), list):
-            logger.error(f"CALENDAR_IDS must be a list, got {type(self.get('CALENDAR_IDS'))}")
+            logger.error("CALENDAR_IDS must be a list, got %s", type(self.get("CALENDAR_IDS")))
             raise ConfigValidationError("CALENDAR_IDS must be a list.")
-
-    def __init__(self, path=CONFIG_PATH):
-        self.path = path
-        logger.debug(f"Config init: path={self.path}")
-        self.data = self.load()
+        self._validated_for = self._file_stamp()
+
+    def __init__(self, path=None):
+        self.path = path or get_config_path()
+        self._validated_for = None
+        self._data = None
+        self._get_cache = {}
+        self._scope_flags = None
+        # Parsed env-var lists keyed by env var name, validated against the
+        # raw string so a changed environment reparses.
+        self._env_list_cache = {}
+        logger.debug("Config init: path=%s", self.path)
+
+    @property
+    def data(self):
+        """The config dict, loaded from disk on first access."""
+        if self._data is None:
+            self._data = self.load()
+        return self._data
+
+    @data.setter
+    def data(self, value):
+        self._data = value
+        self._get_cache.clear()
+        self._scope_flags = None
+
+    def _file_stamp(self):
+        """Return (mtime_ns, size) for the config file, or None if absent."""
+        try:
+            st = os.stat(self.path)
+        except OSError:
+            return None
+        return (st.st_mtime_ns, st.st_size)
 
     def load(self):
-        logger.debug(f"Loading config from {self.path}")
-        if os.path.exists(self.path):
-            with open(self.path) as f:
-                data = json.load(f)
-            logger.debug(f"Loaded config data: {data}")
-            return data
-        logger.debug("Config file not found, using DEFAULTS.")
-        return DEFAULTS.copy()
+        logger.debug("Loading config from %s", self.path)
+        stamp = self._file_stamp()
+        if stamp is None:
+            logger.debug("Config file not found, using DEFAULTS.")
+            return DEFAULTS.copy()
+        cached = _CONFIG_CACHE.get(self.path)
+        if cached is not None and cached[0] == stamp:
+            logger.debug("Config unchanged on disk, reusing cached parse.")
+            # Shallow copy so per-instance key assignments don't leak back.
+            return dict(cached[1])
+        with open(self.path, buffering=65536) as f:
+            data = json.load(f)
+        _CONFIG_CACHE[self.path] = (stamp, dict(data))
+        logger.debug("Loaded config data: %s", data)
+        return data
 
     def save(self):
-        logger.debug(f"Saving config to {self.path}: {self.data}")
+        """Write the config atomically: buffered write to a tempfile, fsync,
+        then os.replace so a crash mid-save can never truncate the config."""
+        logger.debug("Saving config to %s: %s", self.path, self.data)
         os.makedirs(os.path.dirname(self.path), exist_ok=True)
-        with open(self.path, "w") as f:
+        tmp_path = self.path + ".tmp"
+        with open(tmp_path, "w", buffering=65536) as f:
             json.dump(self.data, f, indent=4)
+            f.flush()
+            os.fsync(f.fileno())
+        os.replace(tmp_path, self.path)
+        self._get_cache.clear()
+        self._scope_flags = None
 
     def get(self, key, default=None):
+        # Per-instance memo: repeated lookups of the same key skip the env
+        # probe, dict access, and log formatting. Cleared on save() and
+        # whenever the data dict is replaced. Unhashable defaults (e.g. [])
+        # bypass the cache.
+        try:
+            cache_key = (key, default)
+            if cache_key in self._get_cache:
+                return self._get_cache[cache_key]
+        except TypeError:
+            cache_key = None
+
+        debug = logger.isEnabledFor(logging.DEBUG)
         env_key = f"GTOOL_{key.upper()}"
         if env_key in os.environ:
             val = os.environ[env_key]
-            logger.debug(f"Overriding config key '{key}' with env value: {val}")
-            # Try to parse lists from env vars
+            if debug:
+                logger.debug("Overriding config key '%s' with env value: %s", key, val)
+            # Try to parse lists from env vars, reusing the parse as long as
+            # the raw string is unchanged. (Calls with an unhashable default
+            # like [] bypass the get() memo, so this keeps them from
+            # re-splitting on every lookup.)
             if key in ("SCOPES", "CALENDAR_IDS"):
-                parsed = [v.strip() for v in val.split(",")]
-                logger.debug(f"Parsed env list for '{key}': {parsed}")
-                return parsed
-            return val
-        value = self.data.get(key, default)
-        logger.debug(f"Config get: {key}={value}")
+                cached_env = self._env_list_cache.get(env_key)
+                if cached_env is not None and cached_env[0] == val:
+                    val = cached_env[1]
+                else:
+                    raw = val
+                    val = [v.strip() for v in val.split(",")]
+                    self._env_list_cache[env_key] = (raw, val)
+                if debug:
+                    logger.debug("Parsed env list for '%s': %s", key, val)
+            value = val
+        else:
+            value = self.data.get(key, default)
+            if debug:
+                logger.debug("Config get: %s=%s", key, value)
+        if cache_key is not None:
+            self._get_cache[cache_key] = value
         return value
 
+    def _get_scope_flags(self) -> dict:
+        """Return the Gmail scope flags, scanning the scope list only once.
+
+        The cache is keyed on the scope tuple itself (a cheap C-level
+        compare), so in-place mutation of the SCOPES list is picked up, and
+        it is dropped outright on save or data replacement.
+        """
+        scopes_key = tuple(self.get("SCOPES", []) or ())
+        cached = self._scope_flags
+        if cached is not None and cached[0] == scopes_key:
+            return cached[1]
+        # Exact membership against the known scope URLs instead of lowering
+        # and substring-scanning each entry; the prefix check still catches
+        # Gmail scopes we don't model explicitly (e.g. gmail.send).
+        scope_set = frozenset(scopes_key)
+        gmail_readonly = AVAILABLE_SCOPES["gmail.readonly"] in scope_set
+        gmail_modify = AVAILABLE_SCOPES["gmail.modify"] in scope_set
+        gmail_any = bool(scope_set & GMAIL_SCOPES) or any(s.startswith(GMAIL_SCOPE_PREFIX) for s in scopes_key)
+        flags = {"gmail_any": gmail_any, "gmail_readonly": gmail_readonly, "gmail_modify": gmail_modify}
+        self._scope_flags = (scopes_key, flags)
+        return flags
+
     def is_gmail_enabled(self) -> bool:
         """Check if Gmail is enabled in configuration.
 
@@ -105,9 +229,7 @@ class Config:
         Returns:
             True if Gmail is enabled
         """
-        gmail_enabled = self.get("GMAIL_ENABLED", False)
-        has_gmail_scope = any("gmail" in scope.lower() for scope in self.get("SCOPES", []))
-        return gmail_enabled or has_gmail_scope
+        return self.get("GMAIL_ENABLED", False) or self._get_scope_flags()["gmail_any"]
 
     def has_gmail_scope(self, scope_type: str = "readonly") -> bool:
         """Check if user has required Gmail scope.
@@ -118,11 +240,11 @@ class Config:
         Returns:
             True if user has the requested Gmail scope or a higher level scope
         """
-        scopes = self.get("SCOPES", [])
+        flags = self._get_scope_flags()
         if scope_type == "readonly":
             # User has readonly if they have readonly or modify
-            return any("gmail.readonly" in s or "gmail.modify" in s for s in scopes)
+            return flags["gmail_readonly"] or flags["gmail_modify"]
         elif scope_type == "modify":
             # User has modify only if they explicitly have modify
-            return any("gmail.modify" in s for s in scopes)
+            return flags["gmail_modify"]
         return False
@@ -4,9 +4,9 @@ import datetime
 from dataclasses import dataclass
 
 
-@dataclass
+@dataclass(frozen=True, slots=True)
 class SearchParameters:
-    """Parameters for scheduling/free time search.
+    """Immutable parameters for scheduling/free time search.
 
     Attributes:
         start_datetime: Start of search range (timezone-aware)
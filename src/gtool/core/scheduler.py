@@ -1,17 +1,40 @@
 import datetime
 import logging
+import time
 from typing import Any
 
 from gtool.core.models import SearchParameters
 
 logger = logging.getLogger(__name__)
 
+# How long cached busy-time responses stay fresh, in seconds. Long enough to
+# cover a user iterating on duration/availability parameters, short enough
+# that newly created events show up on the next distinct run.
+BUSY_CACHE_TTL = 60
+
 
 class Scheduler:
     """
     A class to manage scheduling and finding free time slots in Google Calendar.
     """
 
+    # Slots keep instances to a fixed set of fields (no per-instance dict),
+    # which also guards against typo'd attribute assignment.
+    __slots__ = (
+        "start_datetime",
+        "end_datetime",
+        "availability_start",
+        "availability_end",
+        "timezone",
+        "client",
+        "duration",
+        "_duration_seconds",
+        "_start_td",
+        "_end_td",
+        "calendar_ids",
+        "_busy_cache",
+    )
+
     def __init__(
         self,
         client: Any,
@@ -34,9 +57,30 @@ class Scheduler:
             raise ValueError("calendar_ids must be a list of strings.")
         self.client = client
         self.duration = search_params.duration
+        # Precomputed once so the per-interval slot check below avoids a
+        # multiplication on every comparison.
+        self._duration_seconds = search_params.duration * 60
+        # Availability bounds as offsets from midnight, so the per-day loop
+        # derives each window by timedelta addition instead of two
+        # datetime.combine calls per day.
+        self._start_td = datetime.timedelta(
+            hours=search_params.availability_start.hour, minutes=search_params.availability_start.minute
+        )
+        self._end_td = datetime.timedelta(
+            hours=search_params.availability_end.hour, minutes=search_params.availability_end.minute
+        )
         self.calendar_ids = calendar_ids
-        self.logger = logging.getLogger(__name__)
-        self.logger.debug(f"Scheduler initialized with config: {self.__dict__}")
+        # Memoized freebusy responses keyed by (calendar ids, range), so
+        # repeated get_free_slots() calls with the same window (e.g. while
+        # iterating on duration) skip the API round-trip entirely.
+        self._busy_cache: dict[tuple, tuple[float, dict]] = {}
+        logger.debug(
+            "Scheduler initialized: calendars=%s range=%s..%s duration=%s",
+            calendar_ids,
+            self.start_datetime,
+            self.end_datetime,
+            self.duration,
+        )
 
     def is_slot_long_enough(self, start: datetime.datetime, end: datetime.datetime, duration_minutes: int) -> bool:
         """
@@ -75,28 +119,75 @@ class Scheduler:
         Returns:
             List of (start, end) datetime tuples representing free slots.
         """
+        # A non-positive duration can never produce a slot; bail before the
+        # merge work. The slot-length check is inlined below with the
+        # seconds value precomputed, replacing a method call plus
+        # multiplication per interval with a single comparison.
+        if duration_minutes <= 0:
+            return []
+        duration_seconds = duration_minutes * 60
+
+        # If the whole window is shorter than the duration no busy list can
+        # matter, and an empty busy list means the window itself is the only
+        # candidate — both skip the sort/merge below entirely.
+        if (end - start).total_seconds() < duration_seconds:
+            return []
+        if not busy_times:
+            return [(start, end)]
+
         free_slots = []
         cursor = start
-        # Sort and merge overlapping/adjacent busy times
-        busy_sorted = sorted(busy_times, key=lambda b: b[0])
+        # Merge overlapping/adjacent busy times in one pass over the sorted
+        # intervals, tracking the current merged interval in two locals
+        # instead of rebuilding the tail tuple of a list on every overlap.
+        # (Timsort makes the sort near-free when the caller already passes a
+        # start-ordered list, as get_free_slots does.)
+        cur_start = cur_end = None
         merged_busy = []
-        for b_start, b_end in busy_sorted:
-            if not merged_busy:
-                merged_busy.append((b_start, b_end))
+        for b_start, b_end in sorted(busy_times):
+            if cur_end is None:
+                cur_start, cur_end = b_start, b_end
+            elif b_start <= cur_end:  # Overlapping or adjacent
+                if b_end > cur_end:
+                    cur_end = b_end
             else:
-                last_start, last_end = merged_busy[-1]
-                if b_start <= last_end:  # Overlapping or adjacent
-                    merged_busy[-1] = (last_start, max(last_end, b_end))
-                else:
-                    merged_busy.append((b_start, b_end))
+                merged_busy.append((cur_start, cur_end))
+                cur_start, cur_end = b_start, b_end
+        if cur_end is not None:
+            merged_busy.append((cur_start, cur_end))
         for busy_start, busy_end in merged_busy:
-            if self.is_slot_long_enough(cursor, busy_start, duration_minutes):
+            if cursor < busy_start and (busy_start - cursor).total_seconds() >= duration_seconds:
                 free_slots.append((cursor, busy_start))
-            cursor = max(cursor, busy_end)
-        if cursor < end and self.is_slot_long_enough(cursor, end, duration_minutes):
+            if busy_end > cursor:
+                cursor = busy_end
+        if cursor < end and (end - cursor).total_seconds() >= duration_seconds:
             free_slots.append((cursor, end))
         return free_slots
 
+    def _get_busy_cached(self, range_start: datetime.datetime, range_end: datetime.datetime) -> dict:
+        """
+        Fetch busy times for the full range, memoized with a short TTL.
+
+        Args:
+            range_start: Start of the query range.
+            range_end: End of the query range.
+
+        Returns:
+            Dict mapping calendar id to its list of (start, end) busy tuples.
+        """
+        key = (tuple(self.calendar_ids), range_start, range_end)
+        now = time.monotonic()
+        entry = self._busy_cache.get(key)
+        if entry is not None and now - entry[0] < BUSY_CACHE_TTL:
+            return entry[1]
+        busy_by_calendar = self.client.get_range_busy_times(self.calendar_ids, range_start, range_end)
+        self._busy_cache[key] = (now, busy_by_calendar)
+        return busy_by_calendar
+
+    def invalidate_cache(self) -> None:
+        """Drop all cached busy-time responses, forcing a fresh API fetch."""
+        self._busy_cache.clear()
+
     def get_free_slots(self) -> list[tuple[datetime.datetime, datetime.datetime]]:
         """
         Get all free slots between start_datetime and end_datetime (inclusive).
@@ -104,25 +195,34 @@ class Scheduler:
         """
         current_datetime = self.start_datetime.replace(hour=0, minute=0, second=0, microsecond=0)
         end_date = self.end_datetime.date()
-        free_slots = []
+        range_end = datetime.datetime.combine(end_date, datetime.time(23, 59, 59), tzinfo=self.timezone)
+
+        # One freebusy query covers every calendar and the whole range,
+        # replacing the per-(calendar, day) round-trips.
+        busy_by_calendar = self._get_busy_cached(current_datetime, range_end)
+        all_busy = sorted(busy for periods in busy_by_calendar.values() for busy in periods)
 
+        free_slots = []
+        one_day = datetime.timedelta(days=1)
         while current_datetime.date() <= end_date:
             current_date = current_datetime.date()
-            self.logger.debug(f"Processing date: {current_date}")
+            logger.debug("Processing date: %s", current_date)
 
-            # Build availability window for this day
-            day_start = datetime.datetime.combine(current_date, self.availability_start, tzinfo=self.timezone)
-            day_end = datetime.datetime.combine(current_date, self.availability_end, tzinfo=self.timezone)
+            # Build availability window for this day from the precomputed
+            # midnight offsets; current_datetime already sits at 00:00.
+            day_start = current_datetime + self._start_td
+            day_end = current_datetime + self._end_td
 
-            # Collect busy times from all calendars
-            all_busy_times = []
-            for calendar_id in self.calendar_ids:
-                busy_datetime_tuples = self.client.get_day_busy_times(calendar_id, current_date)
-                all_busy_times.extend(busy_datetime_tuples)
+            # Clamp the range-wide busy list to this day's window
+            day_busy = [
+                (max(busy_start, day_start), min(busy_end, day_end))
+                for busy_start, busy_end in all_busy
+                if busy_end > day_start and busy_start < day_end
+            ]
 
-            slots = self.get_free_slots_for_day(all_busy_times, day_start, day_end, self.duration)
+            slots = self.get_free_slots_for_day(day_busy, day_start, day_end, self.duration)
             free_slots.extend(slots)
-            self.logger.info(f"{current_date}: Found {len(slots)} free slots.")
-            current_datetime += datetime.timedelta(days=1)
+            logger.info("%s: Found %d free slots.", current_date, len(slots))
+            current_datetime += one_day
 
         return free_slots
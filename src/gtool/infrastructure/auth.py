@@ -11,9 +11,12 @@ Key Responsibilities:
 - Credential validation and refresh
 """
 
+import datetime
+import functools
 import json
 import logging
 import os
+import threading
 from typing import Optional, cast
 
 from google.auth.transport.requests import Request
@@ -25,6 +28,80 @@ from gtool.infrastructure.exceptions import AuthError
 
 logger = logging.getLogger(__name__)
 
+# Refresh tokens this close to expiry in the background, so the first call
+# after expiry never blocks on the token endpoint round-trip.
+REFRESH_AHEAD = datetime.timedelta(minutes=5)
+
+# Static bodies for the large OAuth failure messages, built once at import
+# instead of re-concatenated inside the error handler.
+_ERR_MISMATCHING_STATE = (
+    "OAuth local-server flow failed (mismatching_state).\n"
+    "This is a CSRF protection check: the 'state' returned to the callback does not match the state in the auth request.\n"
+    "Attempted redirect URI: {redirect_uri}\n\n"
+    "Common causes:\n"
+    "- You opened an old/stale authorization URL from a previous run\n"
+    "- More than one OAuth flow is running at the same time\n"
+    "- The browser auto-reused a previous tab/session\n\n"
+    "Fix:\n"
+    "- Close all in-progress OAuth tabs/windows\n"
+    "- Ensure only one 'gtool' process is running\n"
+    "- Rerun the command and use the newly printed URL exactly once (prefer an incognito/private window)\n"
+    "- If it still happens, switch to a different registered port via GTOOL_OAUTH_PORT"
+)
+_ERR_REDIRECT_URI_MISMATCH = (
+    "OAuth failed: redirect_uri_mismatch\n"
+    "Attempted redirect URI: {redirect_uri}\n"
+    "Add this exact URI to Authorized redirect URIs for your OAuth client OR adjust "
+    "GTOOL_OAUTH_PORT to a registered port."
+)
+_ERR_WEB_LOCAL_SERVER_FAILED = (
+    "OAuth local-server flow failed.\n"
+    "Attempted redirect URI: {redirect_uri}\n"
+    "Error: {error}\n"
+    "Console/OOB fallback is not allowed for WEB OAuth clients.\n"
+    "Fix by registering additional redirect URIs (http://localhost:<port>/) and setting "
+    "GTOOL_OAUTH_PORTS to a registered, free port."
+)
+
+
+class _LazyJson:
+    """Defers json.dumps of a debug payload until the record is emitted.
+
+    Passed as a logging argument, so when DEBUG is filtered out the dict is
+    never serialized at all.
+    """
+
+    __slots__ = ("payload",)
+
+    def __init__(self, payload: dict):
+        self.payload = payload
+
+    def __str__(self) -> str:
+        return json.dumps(self.payload)
+
+
+@functools.lru_cache(maxsize=1)
+def _parse_oauth_host(raw: str) -> str:
+    """Normalize the OAuth host override, parsed once per raw env value."""
+    return raw.strip() or "localhost"
+
+
+@functools.lru_cache(maxsize=1)
+def _parse_oauth_port(raw: Optional[str]) -> int:
+    """Parse the OAuth port override, parsed once per raw env value.
+
+    Defaults to 8401 when unset or invalid; the invalid-value warning is
+    correspondingly logged once rather than per flow.
+    """
+    default_port = 8401
+    if not raw:
+        return default_port
+    try:
+        return int(raw.strip())
+    except ValueError:
+        logger.warning("Invalid GTOOL_OAUTH_PORT value '%s', using default %s", raw, default_port)
+        return default_port
+
 
 class GoogleAuth:
     """Manages Google OAuth authentication and credential lifecycle.
@@ -39,6 +116,16 @@ class GoogleAuth:
     to obtain valid credentials, ensuring consistent auth behavior across the application.
     """
 
+    # Process-wide token cache keyed by token file path, storing
+    # (mtime_ns, requested-scopes tuple, Credentials, stored scopes). Repeat
+    # credential fetches then cost one stat() instead of a read + JSON parse.
+    _token_cache: dict = {}
+
+    # Single in-flight proactive token refresh; the worker is a daemon
+    # thread so a slow token endpoint can never hold up interpreter exit.
+    _refresh_thread: Optional[threading.Thread] = None
+    _refresh_lock = threading.Lock()
+
     def __init__(self, config: Config):
         """Initialize GoogleAuth with configuration.
 
@@ -50,6 +137,7 @@ class GoogleAuth:
         """
         self.config = config
         self._oauth_client_type: Optional[str] = None
+        self._token_dir_ensured = False
 
         raw_credentials_file = config.get("CREDENTIALS_FILE")
         if not raw_credentials_file or not isinstance(raw_credentials_file, str):
@@ -73,7 +161,8 @@ class GoogleAuth:
             self.scopes = []
 
         logger.debug(
-            json.dumps(
+            "%s",
+            _LazyJson(
                 {
                     "component": "GoogleAuth",
                     "event": "init",
@@ -81,12 +170,17 @@ class GoogleAuth:
                     "token_file": self.token_file,
                     "scopes": self.scopes,
                 }
-            )
+            ),
         )
 
         if not self.scopes:
             raise AuthError("SCOPES not configured")
 
+        # Precomputed for the fast paths in _detect_scope_changes and
+        # _notify_scope_change.
+        self._scopes_sorted_tuple = tuple(sorted(self.scopes))
+        self._scopes_set = frozenset(self.scopes)
+
     def get_credentials(self) -> Credentials:
         """Get valid Google API credentials.
 
@@ -103,52 +197,124 @@ class GoogleAuth:
         Raises:
             CLIError: If authentication fails
         """
-        logger.debug(json.dumps({"component": "GoogleAuth", "event": "get_credentials:start"}))
+        logger.debug("%s", _LazyJson({"component": "GoogleAuth", "event": "get_credentials:start"}))
 
-        # Step 1: Try to load existing token
-        creds = self._load_token_from_file()
+        # Step 1: Try to load existing token (one read covers both the
+        # credentials and the stored scopes)
+        creds, stored_scopes = self._load_token()
 
         # Step 2: Validate and potentially refresh
         if creds:
-            logger.debug(json.dumps({"component": "GoogleAuth", "event": "token:existing"}))
+            logger.debug("%s", _LazyJson({"component": "GoogleAuth", "event": "token:existing"}))
             if self._validate_credentials(creds):
-                logger.debug(json.dumps({"component": "GoogleAuth", "event": "token:valid"}))
+                logger.debug("%s", _LazyJson({"component": "GoogleAuth", "event": "token:valid"}))
                 # Check for scope changes
-                stored_scopes = self._load_token_scopes()
                 if self._detect_scope_changes(self.scopes, stored_scopes):
                     self._notify_scope_change(self.scopes, stored_scopes)
                     # Refresh with new scopes
                     creds = self._refresh_token(creds)
+                else:
+                    # Still valid but close to expiry: refresh off-thread so
+                    # the caller keeps the current credentials without
+                    # waiting on the token endpoint.
+                    self._maybe_refresh_ahead(creds)
                 return creds
             elif creds.refresh_token:
-                logger.debug(json.dumps({"component": "GoogleAuth", "event": "token:expired_refreshing"}))
+                logger.debug("%s", _LazyJson({"component": "GoogleAuth", "event": "token:expired_refreshing"}))
                 creds = self._refresh_token(creds)
                 self._save_token(creds)
                 return creds
 
         # Step 3: No valid token, run OAuth flow
-        logger.debug(json.dumps({"component": "GoogleAuth", "event": "oauth:start"}))
+        logger.debug("%s", _LazyJson({"component": "GoogleAuth", "event": "oauth:start"}))
         creds = self._run_oauth_flow()
         self._save_token(creds)
         return creds
 
-    def _load_token_from_file(self) -> Optional[Credentials]:
-        """Load existing token from file.
+    def _maybe_refresh_ahead(self, credentials: Credentials) -> None:
+        """Kick off a background refresh when credentials are close to expiry.
+
+        Only one refresh is ever in flight; the worker refreshes in place and
+        saves the token, so the next load picks up the extended expiry. Any
+        failure is logged and left for the normal blocking path to handle.
+
+        Args:
+            credentials: Currently valid credentials to refresh proactively.
+        """
+        expiry = getattr(credentials, "expiry", None)
+        if not isinstance(expiry, datetime.datetime) or not credentials.refresh_token:
+            return
+        # google-auth expiries are naive UTC (utcnow is deprecated on 3.12).
+        now = datetime.datetime.now(datetime.UTC).replace(tzinfo=None)
+        if expiry - now >= REFRESH_AHEAD:
+            return
+
+        with GoogleAuth._refresh_lock:
+            thread = GoogleAuth._refresh_thread
+            if thread is not None and thread.is_alive():
+                return
+            logger.debug("%s", _LazyJson({"component": "GoogleAuth", "event": "token:refresh:background_start"}))
+            thread = threading.Thread(
+                target=self._background_refresh,
+                args=(credentials,),
+                name="gtool-token-refresh",
+                daemon=True,
+            )
+            GoogleAuth._refresh_thread = thread
+            thread.start()
+
+    def _background_refresh(self, credentials: Credentials) -> None:
+        """Worker body for the proactive refresh; never raises."""
+        try:
+            credentials.refresh(Request())
+            self._save_token(credentials)
+            logger.debug("%s", _LazyJson({"component": "GoogleAuth", "event": "token:refresh:background_success"}))
+        except Exception as e:
+            logger.warning(
+                json.dumps({"component": "GoogleAuth", "event": "token:refresh:background_failed", "error": str(e)})
+            )
+
+    def _load_token(self) -> tuple[Optional[Credentials], list[str]]:
+        """Load the token file once, returning (credentials, stored scopes).
+
+        The file is parsed at most once per on-disk version: results are kept
+        in the class-level cache keyed by path and validated against the
+        file's mtime, so repeat fetches within a process cost a single stat().
 
         Returns:
-            Credentials object if token file exists, None otherwise
+            (Credentials, scopes) from the token file, or (None, []) if the
+            file is missing or unreadable.
         """
-        if not os.path.exists(self.token_file):
-            logger.debug(f"Token file does not exist: {self.token_file}")
-            return None
+        try:
+            st = os.stat(self.token_file)
+        except OSError:
+            logger.debug("Token file does not exist: %s", self.token_file)
+            return None, []
+
+        cached = GoogleAuth._token_cache.get(self.token_file)
+        if cached is not None and cached[0] == st.st_mtime_ns and cached[1] == self._scopes_sorted_tuple:
+            return cached[2], cached[3]
 
         try:
-            logger.debug(json.dumps({"component": "GoogleAuth", "event": "token:load", "path": self.token_file}))
-            creds = Credentials.from_authorized_user_file(self.token_file, self.scopes)
-            return creds
+            logger.debug("%s", _LazyJson({"component": "GoogleAuth", "event": "token:load", "path": self.token_file}))
+            with open(self.token_file, "r") as f:
+                token_data = json.load(f)
+            creds = Credentials.from_authorized_user_info(token_data, self.scopes)
+            scopes = token_data.get("scopes", [])
         except Exception as e:
             logger.warning(json.dumps({"component": "GoogleAuth", "event": "token:load_failed", "error": str(e)}))
-            return None
+            return None, []
+
+        GoogleAuth._token_cache[self.token_file] = (st.st_mtime_ns, self._scopes_sorted_tuple, creds, scopes)
+        return creds, scopes
+
+    def _load_token_from_file(self) -> Optional[Credentials]:
+        """Load existing token from file.
+
+        Returns:
+            Credentials object if token file exists, None otherwise
+        """
+        return self._load_token()[0]
 
     def _load_token_scopes(self) -> list[str]:
         """Read existing scopes from token file.
@@ -159,19 +325,7 @@ class GoogleAuth:
         Returns:
             List of scopes stored in token file, or empty list if file doesn't exist
         """
-        if not os.path.exists(self.token_file):
-            logger.debug(f"Token file does not exist: {self.token_file}")
-            return []
-
-        try:
-            with open(self.token_file, "r") as f:
-                token_data = json.load(f)
-                scopes = token_data.get("scopes", [])
-                logger.debug(json.dumps({"component": "GoogleAuth", "event": "token:scopes_loaded", "scopes": scopes}))
-                return scopes
-        except Exception as e:
-            logger.warning(json.dumps({"component": "GoogleAuth", "event": "token:scopes_failed", "error": str(e)}))
-            return []
+        return self._load_token()[1]
 
     def _detect_scope_changes(self, new_scopes: list[str], stored_scopes: list[str]) -> bool:
         """Compare requested scopes with scopes in existing token.
@@ -186,12 +340,24 @@ class GoogleAuth:
         Returns:
             True if new scopes detected, False otherwise
         """
-        new_set = set(new_scopes)
+        # Fast paths: identical list objects or element-wise equal lists
+        # can't differ, and on the cached-token path the stored scopes almost
+        # always match the requested scopes exactly, so a tuple compare
+        # against the precomputed sorted tuple avoids building sets.
+        if new_scopes is stored_scopes or new_scopes == stored_scopes:
+            return False
+        if tuple(sorted(stored_scopes)) == self._scopes_sorted_tuple:
+            return False
+
+        # The requested scopes are almost always self.scopes; reuse the
+        # frozenset built at init instead of re-setifying per call.
+        new_set = self._scopes_set if new_scopes is self.scopes else frozenset(new_scopes)
         stored_set = set(stored_scopes)
 
         has_changes = not new_set.issubset(stored_set)
         logger.debug(
-            json.dumps(
+            "%s",
+            _LazyJson(
                 {
                     "component": "GoogleAuth",
                     "event": "scopes:compare",
@@ -199,7 +365,7 @@ class GoogleAuth:
                     "new": sorted(list(new_set)),
                     "stored": sorted(list(stored_set)),
                 }
-            )
+            ),
         )
         return has_changes
 
@@ -212,9 +378,8 @@ class GoogleAuth:
             new_scopes: New scopes being requested
             stored_scopes: Previously stored scopes
         """
-        new_set = set(new_scopes)
-        stored_set = set(stored_scopes)
-        added_scopes = new_set - stored_set
+        new_set = self._scopes_set if new_scopes is self.scopes else frozenset(new_scopes)
+        added_scopes = new_set - set(stored_scopes)
 
         logger.info(
             json.dumps(
@@ -240,7 +405,8 @@ class GoogleAuth:
             CLIError: If OAuth flow fails
         """
         logger.debug(
-            json.dumps({"component": "GoogleAuth", "event": "oauth:init", "credentials_file": self.credentials_file})
+            "%s",
+            _LazyJson({"component": "GoogleAuth", "event": "oauth:init", "credentials_file": self.credentials_file}),
         )
         attempted_redirect_uri: Optional[str] = None
 
@@ -258,7 +424,7 @@ class GoogleAuth:
                     )
                 logger.info(json.dumps({"component": "GoogleAuth", "event": "oauth:force_console"}))
                 creds = self._run_console_flow(flow)
-                logger.debug(json.dumps({"component": "GoogleAuth", "event": "oauth:success", "mode": "console"}))
+                logger.debug("%s", _LazyJson({"component": "GoogleAuth", "event": "oauth:success", "mode": "console"}))
                 return creds
 
             try:
@@ -268,7 +434,8 @@ class GoogleAuth:
                 attempted_redirect_uri = redirect_uri
 
                 logger.debug(
-                    json.dumps(
+                    "%s",
+                    _LazyJson(
                         {
                             "component": "GoogleAuth",
                             "event": "oauth:local_server_config",
@@ -277,51 +444,32 @@ class GoogleAuth:
                             "redirect_uri": redirect_uri,
                             "scopes": self.scopes,
                         }
-                    )
+                    ),
                 )
 
                 # Ensure the redirect URI is deterministic and matches pre-registered URIs in Google Cloud.
                 flow.redirect_uri = redirect_uri
                 creds_any = flow.run_local_server(host=host, port=port, open_browser=True)
-                logger.debug(json.dumps({"component": "GoogleAuth", "event": "oauth:success", "mode": "local_server"}))
+                logger.debug(
+                    "%s", _LazyJson({"component": "GoogleAuth", "event": "oauth:success", "mode": "local_server"})
+                )
                 return cast(Credentials, creds_any)
             except AuthError:
                 raise
             except Exception as local_error:
+                # Stringify once; the checks and messages below all reuse it.
                 local_error_text = str(local_error)
+                redirect_uri_text = attempted_redirect_uri or "<unknown>"
 
                 if "mismatching_state" in local_error_text or "State not equal" in local_error_text:
-                    raise AuthError(
-                        "OAuth local-server flow failed (mismatching_state).\n"
-                        "This is a CSRF protection check: the 'state' returned to the callback does not match the state in the auth request.\n"
-                        f"Attempted redirect URI: {attempted_redirect_uri or '<unknown>'}\n\n"
-                        "Common causes:\n"
-                        "- You opened an old/stale authorization URL from a previous run\n"
-                        "- More than one OAuth flow is running at the same time\n"
-                        "- The browser auto-reused a previous tab/session\n\n"
-                        "Fix:\n"
-                        "- Close all in-progress OAuth tabs/windows\n"
-                        "- Ensure only one 'gtool' process is running\n"
-                        "- Rerun the command and use the newly printed URL exactly once (prefer an incognito/private window)\n"
-                        "- If it still happens, switch to a different registered port via GTOOL_OAUTH_PORT"
-                    )
+                    raise AuthError(_ERR_MISMATCHING_STATE.format(redirect_uri=redirect_uri_text))
 
-                if "redirect_uri_mismatch" in str(local_error):
-                    raise AuthError(
-                        "OAuth failed: redirect_uri_mismatch\n"
-                        f"Attempted redirect URI: {attempted_redirect_uri or '<unknown>'}\n"
-                        "Add this exact URI to Authorized redirect URIs for your OAuth client OR adjust "
-                        "GTOOL_OAUTH_PORT to a registered port."
-                    )
+                if "redirect_uri_mismatch" in local_error_text:
+                    raise AuthError(_ERR_REDIRECT_URI_MISMATCH.format(redirect_uri=redirect_uri_text))
 
                 if self._oauth_client_type == "web":
                     raise AuthError(
-                        "OAuth local-server flow failed.\n"
-                        f"Attempted redirect URI: {attempted_redirect_uri or '<unknown>'}\n"
-                        f"Error: {local_error}\n"
-                        "Console/OOB fallback is not allowed for WEB OAuth clients.\n"
-                        "Fix by registering additional redirect URIs (http://localhost:<port>/) and setting "
-                        "GTOOL_OAUTH_PORTS to a registered, free port."
+                        _ERR_WEB_LOCAL_SERVER_FAILED.format(redirect_uri=redirect_uri_text, error=local_error_text)
                     )
                 # Fallback to console flow if the local server callback fails (e.g., browser/redirect issues)
                 logger.warning(
@@ -329,12 +477,12 @@ class GoogleAuth:
                         {
                             "component": "GoogleAuth",
                             "event": "oauth:local_server_failed",
-                            "error": str(local_error),
+                            "error": local_error_text,
                         }
                     )
                 )
                 creds = self._run_console_flow(flow)
-                logger.debug(json.dumps({"component": "GoogleAuth", "event": "oauth:success", "mode": "console"}))
+                logger.debug("%s", _LazyJson({"component": "GoogleAuth", "event": "oauth:success", "mode": "console"}))
                 return cast(Credentials, creds)
         except FileNotFoundError:
             logger.error(
@@ -358,7 +506,7 @@ class GoogleAuth:
 
     def _get_oauth_host(self) -> str:
         """Return the host used for the OAuth local server redirect."""
-        return os.environ.get("GTOOL_OAUTH_HOST", "localhost").strip() or "localhost"
+        return _parse_oauth_host(os.environ.get("GTOOL_OAUTH_HOST", "localhost"))
 
     def _get_oauth_port(self) -> int:
         """Return the OAuth redirect port.
@@ -366,16 +514,7 @@ class GoogleAuth:
         Defaults to 8401. Can be overridden with GTOOL_OAUTH_PORT environment variable.
         The port must be pre-registered in Google Cloud Console for web OAuth clients.
         """
-        default_port = 8401
-        raw = os.environ.get("GTOOL_OAUTH_PORT")
-        if not raw:
-            return default_port
-
-        try:
-            return int(raw.strip())
-        except ValueError:
-            logger.warning(f"Invalid GTOOL_OAUTH_PORT value '{raw}', using default {default_port}")
-            return default_port
+        return _parse_oauth_port(os.environ.get("GTOOL_OAUTH_PORT"))
 
     def _create_oauth_flow(self) -> InstalledAppFlow:
         """Create an OAuth flow from either 'installed' or 'web' client secrets JSON."""
@@ -405,7 +544,8 @@ class GoogleAuth:
             if auth_uri == "https://accounts.google.com/o/oauth2/auth":
                 block["auth_uri"] = "https://accounts.google.com/o/oauth2/v2/auth"
                 logger.debug(
-                    json.dumps(
+                    "%s",
+                    _LazyJson(
                         {
                             "component": "GoogleAuth",
                             "event": "oauth:auth_uri_normalized",
@@ -413,36 +553,29 @@ class GoogleAuth:
                             "from": auth_uri,
                             "to": block["auth_uri"],
                         }
-                    )
+                    ),
                 )
             normalized[key] = block
             return normalized
 
         if client_config and "web" in client_config:
             self._oauth_client_type = "web"
-            logger.debug(json.dumps({"component": "GoogleAuth", "event": "oauth:client_type_detected", "type": "web"}))
+            logger.debug(
+                "%s", _LazyJson({"component": "GoogleAuth", "event": "oauth:client_type_detected", "type": "web"})
+            )
             client_config = _normalize_auth_uri(client_config, "web")
             return InstalledAppFlow.from_client_config(client_config, self.scopes)
 
         if client_config and "installed" in client_config:
             self._oauth_client_type = "installed"
             logger.debug(
-                json.dumps({"component": "GoogleAuth", "event": "oauth:client_type_detected", "type": "installed"})
+                "%s", _LazyJson({"component": "GoogleAuth", "event": "oauth:client_type_detected", "type": "installed"})
             )
             client_config = _normalize_auth_uri(client_config, "installed")
-            try:
-                return InstalledAppFlow.from_client_secrets_file(self.credentials_file, self.scopes)
-            except Exception as e:
-                logger.warning(
-                    json.dumps(
-                        {
-                            "component": "GoogleAuth",
-                            "event": "oauth:from_client_secrets_failed",
-                            "error": str(e),
-                        }
-                    )
-                )
-                return InstalledAppFlow.from_client_config(client_config, self.scopes)
+            # The file is already parsed into client_config; building the
+            # flow from the dict avoids from_client_secrets_file re-opening
+            # and re-parsing the same file.
+            return InstalledAppFlow.from_client_config(client_config, self.scopes)
 
         raise AuthError(
             "Invalid credentials file format. Expected an OAuth client secrets JSON with a top-level 'installed' or 'web' key."
@@ -478,10 +611,10 @@ class GoogleAuth:
         Raises:
             CLIError: If refresh fails (e.g., refresh token revoked)
         """
-        logger.debug(json.dumps({"component": "GoogleAuth", "event": "token:refresh:start"}))
+        logger.debug("%s", _LazyJson({"component": "GoogleAuth", "event": "token:refresh:start"}))
         try:
             credentials.refresh(Request())
-            logger.debug(json.dumps({"component": "GoogleAuth", "event": "token:refresh:success"}))
+            logger.debug("%s", _LazyJson({"component": "GoogleAuth", "event": "token:refresh:success"}))
             return credentials
         except Exception as e:
             error_str = str(e)
@@ -530,6 +663,11 @@ class GoogleAuth:
     def _save_token(self, credentials: Credentials):
         """Save credentials to token file.
 
+        The write is atomic (tempfile + os.replace) so a crash mid-write can
+        never leave a truncated token behind, and it is skipped entirely when
+        the serialized token matches the file contents (common when a refresh
+        produced an identical token).
+
         Args:
             credentials: Credentials object to save
 
@@ -537,15 +675,48 @@ class GoogleAuth:
             CLIError: If file write fails
         """
         try:
-            # Ensure directory exists
-            token_dir = os.path.dirname(self.token_file)
-            if token_dir:
-                os.makedirs(token_dir, exist_ok=True)
-
-            logger.debug(json.dumps({"component": "GoogleAuth", "event": "token:save", "path": self.token_file}))
-            with open(self.token_file, "w") as f:
-                f.write(credentials.to_json())
-            logger.debug(json.dumps({"component": "GoogleAuth", "event": "token:save_success"}))
+            new_json = credentials.to_json()
+
+            # Skip the write when nothing changed.
+            try:
+                with open(self.token_file, "r") as f:
+                    if f.read() == new_json:
+                        logger.debug("%s", _LazyJson({"component": "GoogleAuth", "event": "token:save_unchanged"}))
+                        return
+            except OSError:
+                pass
+
+            # Ensure directory exists (checked once per instance; saves a
+            # stat per subsequent refresh write)
+            if not self._token_dir_ensured:
+                token_dir = os.path.dirname(self.token_file)
+                if token_dir:
+                    os.makedirs(token_dir, exist_ok=True)
+                self._token_dir_ensured = True
+
+            logger.debug("%s", _LazyJson({"component": "GoogleAuth", "event": "token:save", "path": self.token_file}))
+            tmp_path = self.token_file + ".tmp"
+            with open(tmp_path, "w") as f:
+                f.write(new_json)
+                f.flush()
+                os.fsync(f.fileno())
+            os.replace(tmp_path, self.token_file)
+
+            # Seed the cache with the just-saved credentials so the next
+            # load skips the read entirely.
+            try:
+                st = os.stat(self.token_file)
+                stored_scopes = json.loads(new_json).get("scopes", [])
+                GoogleAuth._token_cache[self.token_file] = (
+                    st.st_mtime_ns,
+                    self._scopes_sorted_tuple,
+                    credentials,
+                    stored_scopes,
+                )
+            except (OSError, ValueError):
+                GoogleAuth._token_cache.pop(self.token_file, None)
+
+            logger.debug("%s", _LazyJson({"component": "GoogleAuth", "event": "token:save_success"}))
         except Exception as e:
             logger.error(json.dumps({"component": "GoogleAuth", "event": "token:save_failed", "error": str(e)}))
             raise AuthError(f"Failed to save authentication token: {e}")
@@ -562,6 +733,6 @@ class GoogleAuth:
         valid = bool(credentials.valid)
         expired = bool(credentials.expired)
         logger.debug(
-            json.dumps({"component": "GoogleAuth", "event": "token:validate", "valid": valid, "expired": expired})
+            "%s", _LazyJson({"component": "GoogleAuth", "event": "token:validate", "valid": valid, "expired": expired})
         )
         return valid and not expired
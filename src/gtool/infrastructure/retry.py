@@ -4,7 +4,10 @@ Manages retry logic with smart categorization of Google API errors.
 Separates retry policy from API client implementation.
 """
 
+import asyncio
+import functools
 import logging
+import random
 import time
 from enum import Enum
 from typing import Any, Callable
@@ -12,6 +15,8 @@ from typing import Any, Callable
 import google.auth.exceptions
 from googleapiclient.errors import HttpError
 
+from gtool.infrastructure.exceptions import AuthError
+
 logger = logging.getLogger(__name__)
 
 
@@ -24,6 +29,21 @@ class ErrorCategory(str, Enum):
     CLIENT = "CLIENT"  # Client errors (not retryable)
 
 
+# Direct status -> category dispatch for the codes with explicit handling.
+# 403 can be quota exhausted or permission denied; treat as QUOTA for retry
+# logic (most common case). 5xx and remaining 4xx are range-checked in
+# _categorize_error.
+_STATUS_CATEGORY = {
+    401: ErrorCategory.AUTH,
+    403: ErrorCategory.QUOTA,
+    429: ErrorCategory.QUOTA,
+}
+
+# Upper bound on honoring a server-provided Retry-After, so a hostile or
+# broken header can't park the CLI for minutes.
+RETRY_AFTER_CAP = 60.0
+
+
 class RetryPolicy:
     """Manages retry logic for Google API calls with smart error categorization.
 
@@ -33,25 +53,42 @@ class RetryPolicy:
     Args:
         max_retries: Maximum number of retry attempts (default: 3)
         delay: Initial delay in seconds before first retry (default: 1.0)
+        jitter: Randomize each wait over [0, backoff] to decorrelate
+            concurrent retriers (default: True)
+        timeout: Overall retry budget in seconds, measured on the monotonic
+            clock; when the next backoff would pass it, the error is raised
+            instead of slept on (default: None, no budget)
 
     Example:
         >>> policy = RetryPolicy(max_retries=3, delay=1.0)
         >>> result = policy.execute(api_call, arg1, arg2)
     """
 
+    # Categories worth retrying, shared across instances.
+    _RETRYABLE = frozenset((ErrorCategory.QUOTA, ErrorCategory.TRANSIENT))
+
     def __init__(
         self,
         max_retries: int = 3,
         delay: float = 1.0,
+        jitter: bool = True,
+        timeout: float | None = None,
     ) -> None:
         """Initialize RetryPolicy.
 
         Args:
             max_retries: Maximum retry attempts
             delay: Initial delay between retries in seconds
+            jitter: Whether to randomize backoff waits (full jitter)
+            timeout: Overall retry budget in seconds (None for unbounded)
         """
         self.max_retries = max_retries
         self.delay = delay
+        self.jitter = jitter
+        self.timeout = timeout
+        # Backoff caps per attempt, computed once (1 << i is the shifted
+        # form of 2 ** i; the exponent cap keeps huge max_retries sane).
+        self._backoff_schedule = tuple(delay * (1 << min(i, 6)) for i in range(max_retries))
 
     def _categorize_error(self, error: HttpError) -> ErrorCategory:
         """Categorize an HTTP error from Google API.
@@ -71,24 +108,18 @@ class RetryPolicy:
         Raises:
             TypeError: If error is not an HttpError instance
         """
-        if not isinstance(error, HttpError):
+        # A single guarded attribute fetch stands in for the isinstance
+        # check: anything without resp.status is not an HttpError.
+        status_code = getattr(getattr(error, "resp", None), "status", None)
+        if status_code is None:
             raise TypeError(f"Expected HttpError, got {type(error)}")
 
-        status_code = error.resp.status
-
-        # Map status codes to categories
-        if status_code == 401:
-            return ErrorCategory.AUTH
-        elif status_code == 403:
-            # 403 can be quota exhausted or permission denied
-            # Treat as QUOTA for retry logic (most common case)
-            return ErrorCategory.QUOTA
-        elif status_code == 429:
-            return ErrorCategory.QUOTA
-        elif 500 <= status_code < 600:
+        category = _STATUS_CATEGORY.get(status_code)
+        if category is not None:
+            return category
+        if 500 <= status_code < 600:
             return ErrorCategory.TRANSIENT
-        else:
-            return ErrorCategory.CLIENT
+        return ErrorCategory.CLIENT
 
     def should_retry(self, error_category: ErrorCategory) -> bool:
         """Determine if an error should be retried.
@@ -99,14 +130,72 @@ class RetryPolicy:
         Returns:
             bool: True if error should be retried, False otherwise
         """
-        return error_category in {ErrorCategory.QUOTA, ErrorCategory.TRANSIENT}
+        return error_category in RetryPolicy._RETRYABLE
+
+    def _retry_wait(self, exc: Exception, attempt: int) -> Any:
+        """Decide whether a failed attempt should be retried.
+
+        Args:
+            exc: Exception raised by the attempted call
+            attempt: 1-based number of the attempt that just failed
+
+        Returns:
+            Backoff wait time in seconds, or None when the error is not
+            retryable or the retry budget is exhausted.
+        """
+        # Categorize HttpErrors; anything else is treated as TRANSIENT
+        if isinstance(exc, HttpError):
+            error_category = self._categorize_error(exc)
+        else:
+            error_category = ErrorCategory.TRANSIENT
+
+        if not self.should_retry(error_category) or attempt > self.max_retries:
+            return None
+
+        # Honor the server's Retry-After header when present (429/503 quota
+        # responses); the server knows when capacity frees up better than a
+        # fixed curve does.
+        retry_after = self._retry_after_seconds(exc)
+        if retry_after is not None:
+            return min(retry_after, RETRY_AFTER_CAP)
+
+        # Exponential backoff from the precomputed schedule. With jitter the
+        # wait is drawn uniformly from [0, backoff] (full jitter), so many
+        # callers retrying after the same quota error don't all fire at once.
+        backoff = self._backoff_schedule[attempt - 1]
+        if self.jitter:
+            return random.uniform(0, backoff)
+        return backoff
+
+    @staticmethod
+    def _retry_after_seconds(exc: Exception) -> Any:
+        """Extract a numeric Retry-After value from an HttpError, if any.
+
+        Args:
+            exc: Exception raised by the attempted call
 
-    def execute(self, func: Callable[..., Any], *args: Any, **kwargs: Any) -> Any:
+        Returns:
+            Seconds to wait as a float, or None when the header is absent or
+            not a plain number (HTTP-date forms are ignored).
+        """
+        getter = getattr(getattr(exc, "resp", None), "get", None)
+        if getter is None:
+            return None
+        raw = str(getter("retry-after", "") or "")
+        if raw.isdigit():
+            return float(raw)
+        return None
+
+    def execute(self, func: Callable[..., Any], *args: Any, retryable: bool = True, **kwargs: Any) -> Any:
         """Execute function with retry logic.
 
         Args:
             func: Callable to execute
             *args: Positional arguments to pass to func
+            retryable: When False, call func exactly once and let any
+                exception propagate untouched. Non-idempotent operations
+                (deletes, sends) pass False so a 500 whose side effect may
+                have landed is never replayed.
             **kwargs: Keyword arguments to pass to func
 
         Returns:
@@ -116,33 +205,100 @@ class RetryPolicy:
             AuthenticationError: If Google auth error occurs
             Exception: Original exception if retries exhausted or error not retryable
         """
+        if not retryable:
+            # One attempt, no backoff — but auth failures still honor the
+            # AuthError contract promised above.
+            try:
+                return func(*args, **kwargs)
+            except google.auth.exceptions.GoogleAuthError as exc:
+                logger.debug("Google auth error caught and wrapped: %s", exc)
+                raise AuthError(f"Authentication failed: {exc}") from exc
+
         attempt = 0
+        deadline = time.monotonic() + self.timeout if self.timeout is not None else None
 
-        while attempt <= self.max_retries:
+        # The except block below either retries or re-raises, so the loop has
+        # exactly one terminal path per iteration and no unreachable
+        # fall-through return after it.
+        while True:
             try:
                 return func(*args, **kwargs)
             except google.auth.exceptions.GoogleAuthError as exc:
                 # Wrap Google auth exceptions as AuthError
                 # CLI layer will translate this to AuthenticationError for user-facing messages
-                from gtool.infrastructure.exceptions import AuthError
-
-                logger.debug(f"Google auth error caught and wrapped: {exc}")
+                logger.debug("Google auth error caught and wrapped: %s", exc)
                 raise AuthError(f"Authentication failed: {exc}") from exc
             except Exception as exc:
                 attempt += 1
+                wait_time = self._retry_wait(exc, attempt)
+                if wait_time is None:
+                    raise
+                # Monotonic deadline: don't sleep past the retry budget just
+                # to fail afterwards.
+                if deadline is not None and time.monotonic() + wait_time > deadline:
+                    raise
+                time.sleep(wait_time)
+
+    async def execute_async(self, func: Callable[..., Any], *args: Any, retryable: bool = True, **kwargs: Any) -> Any:
+        """Execute function with retry logic without blocking the event loop.
 
-                # Try to categorize the error
-                error_category = ErrorCategory.TRANSIENT
-                try:
-                    error_category = self._categorize_error(exc)
-                except (TypeError, AttributeError):
-                    # If categorization fails (not an HttpError), treat as TRANSIENT
-                    error_category = ErrorCategory.TRANSIENT
+        Mirrors execute(), but backs off with asyncio.sleep so concurrent
+        tasks keep running during retry waits. The wrapped func itself is
+        still invoked synchronously.
 
-                # Check if we should retry
-                if not self.should_retry(error_category) or attempt > self.max_retries:
+        Args:
+            func: Callable to execute
+            *args: Positional arguments to pass to func
+            retryable: When False, call func exactly once and let any
+                exception propagate untouched.
+            **kwargs: Keyword arguments to pass to func
+
+        Returns:
+            Result of func execution
+
+        Raises:
+            AuthenticationError: If Google auth error occurs
+            Exception: Original exception if retries exhausted or error not retryable
+        """
+        if not retryable:
+            try:
+                return func(*args, **kwargs)
+            except google.auth.exceptions.GoogleAuthError as exc:
+                logger.debug("Google auth error caught and wrapped: %s", exc)
+                raise AuthError(f"Authentication failed: {exc}") from exc
+
+        attempt = 0
+        deadline = time.monotonic() + self.timeout if self.timeout is not None else None
+        while True:
+            try:
+                return func(*args, **kwargs)
+            except google.auth.exceptions.GoogleAuthError as exc:
+                logger.debug("Google auth error caught and wrapped: %s", exc)
+                raise AuthError(f"Authentication failed: {exc}") from exc
+            except Exception as exc:
+                attempt += 1
+                wait_time = self._retry_wait(exc, attempt)
+                if wait_time is None:
+                    raise
+                if deadline is not None and time.monotonic() + wait_time > deadline:
                     raise
+                await asyncio.sleep(wait_time)
 
-                # Exponential backoff: delay * (2 ** (attempt - 1))
-                wait_time = self.delay * (2 ** (attempt - 1))
-                time.sleep(wait_time)
+
+@functools.lru_cache(maxsize=8)
+def get_retry_policy(max_retries: int = 3, delay: float = 1.0) -> RetryPolicy:
+    """Return a shared RetryPolicy for the given configuration.
+
+    RetryPolicy keeps no per-call state (attempt counters live inside
+    execute), so one instance per config tuple can serve every caller in
+    the process; repeat CLI dispatches skip the constructor and backoff
+    schedule rebuild.
+
+    Args:
+        max_retries: Maximum retry attempts
+        delay: Initial delay between retries in seconds
+
+    Returns:
+        A process-wide RetryPolicy shared by all callers with these settings.
+    """
+    return RetryPolicy(max_retries=max_retries, delay=delay)
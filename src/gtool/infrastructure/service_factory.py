@@ -4,11 +4,14 @@ Uses composition pattern to inject authentication and build Google API
 services on demand.
 """
 
-from typing import Any
+from __future__ import annotations
 
-from googleapiclient import discovery
+import datetime
+import threading
+from typing import TYPE_CHECKING, Any
 
-from gtool.infrastructure.auth import GoogleAuth
+if TYPE_CHECKING:
+    from gtool.infrastructure.auth import GoogleAuth
 
 
 class ServiceFactory:
@@ -22,8 +25,13 @@ class ServiceFactory:
 
     Attributes:
         _auth: GoogleAuth instance.
+        _services: Built services memoized by (api_name, api_version).
     """
 
+    # Re-validate credentials through GoogleAuth once they are this close
+    # to expiry, rather than on every service build.
+    _CREDS_EXPIRY_MARGIN = datetime.timedelta(minutes=1)
+
     def __init__(self, auth: GoogleAuth) -> None:
         """Initialize the ServiceFactory with authentication.
 
@@ -31,6 +39,29 @@ class ServiceFactory:
             auth: GoogleAuth instance to use for service credentials.
         """
         self._auth = auth
+        self._services: dict = {}
+        self._creds: Any = None
+        self._build_lock = threading.Lock()
+
+    def _get_creds(self) -> Any:
+        """Return credentials, re-validating via GoogleAuth only near expiry.
+
+        GoogleAuth.get_credentials already caches the parsed token, but it
+        still stats the token file and re-checks validity on every call.
+        Building several services in a row (calendar + gmail) only needs
+        that work once, so the factory holds on to the Credentials object
+        until its expiry comes within the margin above.
+        """
+        creds = self._creds
+        if creds is not None:
+            expiry = getattr(creds, "expiry", None)
+            # google-auth expiries are naive UTC (utcnow is deprecated on 3.12).
+            now = datetime.datetime.now(datetime.UTC).replace(tzinfo=None)
+            if not isinstance(expiry, datetime.datetime) or expiry - now > self._CREDS_EXPIRY_MARGIN:
+                return creds
+        creds = self._auth.get_credentials()
+        self._creds = creds
+        return creds
 
     def build_service(self, api_name: str, api_version: str) -> Any:
         """Build a Google API service.
@@ -50,8 +81,53 @@ class ServiceFactory:
             >>> calendar = factory.build_service("calendar", "v3")
             >>> gmail = factory.build_service("gmail", "v1")
         """
-        return discovery.build(
-            api_name,
-            api_version,
-            credentials=self._auth.get_credentials(),
-        )
+        # Parsing the discovery document is the dominant non-network cost of
+        # client construction, so reuse the built service for repeated
+        # requests of the same API within this factory's lifetime. The hit
+        # path stays lock-free (dict.get is atomic under the GIL); the lock
+        # only serializes the build so concurrent callers can't both pay for
+        # constructing the same service.
+        key = (api_name, api_version)
+        service = self._services.get(key)
+        if service is not None:
+            return service
+        with self._build_lock:
+            service = self._services.get(key)
+            if service is None:
+                # Imported here so commands that never touch Google APIs
+                # don't pay for googleapiclient's transitive import graph.
+                from googleapiclient import discovery
+
+                # static_discovery uses the discovery JSON bundled with
+                # google-api-python-client, avoiding a live HTTPS fetch of
+                # the discovery document on every process start.
+                service = discovery.build(
+                    api_name,
+                    api_version,
+                    credentials=self._get_creds(),
+                    cache_discovery=False,
+                    static_discovery=True,
+                )
+                self._services[key] = service
+        return service
+
+    def build_batch(self, api_name: str, api_version: str) -> Any:
+        """Build a BatchHttpRequest bound to the given API.
+
+        Lets callers bundle up to 100 sub-requests (e.g. Gmail messages.get
+        calls) into a single HTTP round-trip; the underlying service comes
+        from the memoized build_service cache.
+
+        Args:
+            api_name: Name of the Google API (e.g., "calendar", "gmail").
+            api_version: Version of the API (e.g., "v3", "v1").
+
+        Returns:
+            A new BatchHttpRequest for the service.
+
+        Example:
+            >>> batch = factory.build_batch("gmail", "v1")
+            >>> batch.add(svc.users().messages().get(userId="me", id=mid), callback=cb)
+            >>> batch.execute()
+        """
+        return self.build_service(api_name, api_version).new_batch_http_request()
@@ -3,25 +3,37 @@ Datetime parsing and formatting utilities for gtool.
 """
 
 import datetime
+import functools
 import zoneinfo
 from typing import Optional
 
 
+@functools.lru_cache(maxsize=8)
+def _resolve_zone(tz: Optional[str]) -> Optional[zoneinfo.ZoneInfo]:
+    """Resolve a timezone name to a ZoneInfo, or None if absent/invalid."""
+    if not tz:
+        return None
+    try:
+        return zoneinfo.ZoneInfo(tz)
+    except Exception:
+        return None
+
+
 def parse_date_range(range_str: str, tz: Optional[str] = None) -> tuple[datetime.datetime, datetime.datetime]:
     """
     Parse a range string like 'today+1', 'tomorrow+2' and return (start_datetime, end_datetime) as timezone-aware datetime objects.
 
     Returns start of day (00:00:00) and end of day (23:59:59) for the calculated dates.
     """
-    # Get current time in the specified timezone
-    if tz:
-        try:
-            timezone = zoneinfo.ZoneInfo(tz)
-            today = datetime.datetime.now(timezone)
-        except Exception:
-            today = datetime.datetime.now()
-    else:
-        today = datetime.datetime.now()
+    # Get current time in the specified timezone (resolved once, cached)
+    timezone = _resolve_zone(tz)
+    today = datetime.datetime.now(timezone)
+
+    # Fast path for the default range: no keyword scanning or offset math.
+    if range_str.lower() == "today":
+        start_datetime = datetime.datetime.combine(today.date(), datetime.time(0, 0, 0), tzinfo=timezone)
+        end_datetime = datetime.datetime.combine(today.date(), datetime.time(23, 59, 59), tzinfo=timezone)
+        return start_datetime, end_datetime
 
     base = today
     weekdays = ["monday", "tuesday", "wednesday", "thursday", "friday", "saturday", "sunday"]
@@ -58,38 +70,50 @@ def parse_date_range(range_str: str, tz: Optional[str] = None) -> tuple[datetime
     end_date = (base + datetime.timedelta(days=offset)).date()
 
     # Convert to timezone-aware datetime objects (start of day and end of day)
-    if tz:
-        try:
-            timezone = zoneinfo.ZoneInfo(tz)
-        except Exception:
-            timezone = None
-    else:
-        timezone = None
-
     start_datetime = datetime.datetime.combine(start_date, datetime.time(0, 0, 0), tzinfo=timezone)
     end_datetime = datetime.datetime.combine(end_date, datetime.time(23, 59, 59), tzinfo=timezone)
 
     return start_datetime, end_datetime
 
 
-def parse_time_option(value: str, default: Optional[datetime.time] = None) -> datetime.time:
-    """Parse a time string (HH:MM) or return default."""
-    if not value:
-        return default or datetime.datetime.now().time()
+@functools.lru_cache(maxsize=32)
+def _parse_time_cached(value: str) -> datetime.time:
+    """Parse and memoize an HH:MM time string; raise ValueError if invalid."""
     try:
         return datetime.time.fromisoformat(value)
     except Exception:
         raise ValueError(f"Invalid time format: {value}")
 
 
+def parse_time_option(value: str, default: Optional[datetime.time] = None) -> datetime.time:
+    """Parse a time string (HH:MM) or return default."""
+    if not value:
+        return default or datetime.datetime.now().time()
+    return _parse_time_cached(value)
+
+
+_EMPTY: dict = {}
+
+
+def event_start_key(event: dict, _get=dict.get) -> str:
+    """
+    Return the raw start timestamp string of an event, for sorting.
+
+    Timed events yield their RFC3339 dateTime, all-day events their date;
+    both sort correctly as plain strings. The bound dict.get default keeps
+    this cheap on hot per-event paths.
+    """
+    start = _get(event, "start") or _EMPTY
+    return _get(start, "dateTime") or _get(start, "date")
+
+
 def get_event_date(event: dict) -> str:
     """
     Extract date string (YYYY-MM-DD) from event start time.
 
     Handles both timed events (with dateTime) and all-day events (with date).
     """
-    dt_str = event["start"].get("dateTime") or event["start"].get("date")
-    return dt_str.split("T")[0]
+    return event_start_key(event).split("T")[0]
 
 
 def format_event_time(event: dict, timezone: str) -> str:
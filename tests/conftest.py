@@ -29,6 +29,7 @@ def mock_config(tmp_path):
         "GMAIL_ENABLED": True,
     }
     config = Config()
+    config.path = str(tmp_path / "config.json")
     config.data = config_data
     return config
 
@@ -76,7 +76,7 @@ def test_free_command(mock_config, busy_times):
     end_dt = datetime.datetime(2025, 5, 3, 23, 59, 59, tzinfo=tz)
 
     mock_client = Mock()
-    mock_client.get_day_busy_times.return_value = busy_times
+    mock_client.get_range_busy_times.return_value = {"primary": busy_times}
 
     with (
         patch("gtool.cli.main.create_calendar_client", return_value=mock_client),
@@ -111,7 +111,7 @@ def test_free_command(mock_config, busy_times):
 def test_free_command_pretty(mock_config):
     """Test free command with --pretty flag."""
     mock_client = Mock()
-    mock_client.get_day_busy_times.return_value = []
+    mock_client.get_range_busy_times.return_value = {"primary": []}
 
     with patch("gtool.cli.main.create_calendar_client", return_value=mock_client):
         runner = CliRunner()
@@ -124,7 +124,7 @@ def test_free_command_pretty(mock_config):
 def test_free_command_no_args_defaults_to_today(mock_config):
     """Test free command with no date argument defaults to today."""
     mock_client = Mock()
-    mock_client.get_day_busy_times.return_value = []
+    mock_client.get_range_busy_times.return_value = {"primary": []}
 
     with patch("gtool.cli.main.create_calendar_client", return_value=mock_client):
         runner = CliRunner()
@@ -136,7 +136,7 @@ def test_free_command_no_args_defaults_to_today(mock_config):
 def test_free_command_with_duration(mock_config):
     """Test free command with custom duration."""
     mock_client = Mock()
-    mock_client.get_day_busy_times.return_value = []
+    mock_client.get_range_busy_times.return_value = {"primary": []}
 
     with patch("gtool.cli.main.create_calendar_client", return_value=mock_client):
         runner = CliRunner()
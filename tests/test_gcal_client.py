@@ -37,9 +37,10 @@ def test_gcal_client_get_events(mock_google_service):
             }
         ]
     }
+    mock_google_service.events.return_value.list_next.return_value = None
 
     client = CalendarClient(service_factory=None, service=mock_google_service)
-    events = client.get_events("primary", (date(2024, 1, 15), date(2024, 1, 16)))
+    events = list(client.get_events("primary", (date(2024, 1, 15), date(2024, 1, 16))))
 
     assert len(events) == 1
     assert events[0]["summary"] == "Meeting"
@@ -7,6 +7,25 @@ No @patch decorators - all dependencies injected via constructor.
 from gtool.clients.gmail import GmailClient, extract_subject_from_headers
 
 
+class FakeBatchRequest:
+    """Minimal stand-in for BatchHttpRequest that executes sub-requests inline."""
+
+    def __init__(self):
+        self._requests = []
+
+    def add(self, request, callback=None, request_id=None):
+        self._requests.append((request_id, request, callback))
+
+    def execute(self):
+        for request_id, request, callback in self._requests:
+            callback(request_id, request.execute(), None)
+
+
+def _use_fake_batch(mock_service):
+    """Route the service's batch factory through FakeBatchRequest."""
+    mock_service.new_batch_http_request.side_effect = FakeBatchRequest
+
+
 def test_gmail_client_list_messages(mock_google_service):
     """FR-005: GmailClient.list_messages() should return message list."""
     # Mock list() API call
@@ -34,6 +53,7 @@ def test_gmail_client_list_messages(mock_google_service):
         },
     ]
 
+    _use_fake_batch(mock_google_service)
     client = GmailClient(service_factory=None, service=mock_google_service)
     messages = client.list_messages(query="is:unread", limit=10)
 
@@ -129,6 +149,7 @@ def test_gmail_list_includes_subjects(mock_google_service, gmail_message_with_su
         gmail_message_unicode_subject,
     ]
 
+    _use_fake_batch(mock_google_service)
     client = GmailClient(service_factory=None, service=mock_google_service)
     messages = client.list_messages(query="", limit=10)
 
@@ -140,3 +161,32 @@ def test_gmail_list_includes_subjects(mock_google_service, gmail_message_with_su
     # Verify other fields are preserved
     assert messages[0]["id"] == "msg123"
     assert messages[1]["id"] == "msg999"
+
+
+def test_gmail_list_chunks_metadata_batches(mock_google_service):
+    """Metadata fetches for >100 messages are split across multiple batches."""
+    listed = [{"id": f"msg{i}", "threadId": f"thread{i}"} for i in range(150)]
+    mock_google_service.users.return_value.messages.return_value.list.return_value.execute.return_value = {
+        "messages": listed,
+        "resultSizeEstimate": 150,
+    }
+    mock_google_service.users.return_value.messages.return_value.get.return_value.execute.side_effect = [
+        {"id": m["id"], "snippet": "preview", "payload": {"headers": [{"name": "Subject", "value": "S"}]}}
+        for m in listed
+    ]
+
+    batches = []
+
+    def make_batch():
+        batch = FakeBatchRequest()
+        batches.append(batch)
+        return batch
+
+    mock_google_service.new_batch_http_request.side_effect = make_batch
+    client = GmailClient(service_factory=None, service=mock_google_service)
+    messages = client.list_messages(limit=150)
+
+    assert len(messages) == 150
+    assert len(batches) == 2
+    assert len(batches[0]._requests) == 100
+    assert len(batches[1]._requests) == 50
@@ -54,7 +54,7 @@ class TestGoogleAuthInitialization:
 class TestGoogleAuthGetCredentials:
     """Test GoogleAuth.get_credentials() method - main credential flow."""
 
-    @patch("google.oauth2.credentials.Credentials.from_authorized_user_file")
+    @patch("google.oauth2.credentials.Credentials.from_authorized_user_info")
     def test_load_existing_valid_token(self, mock_creds_from_file, mock_config, tmp_path):
         """get_credentials should load existing token if valid."""
         # Setup
@@ -75,7 +75,7 @@ class TestGoogleAuthGetCredentials:
         assert result == mock_creds
         mock_creds_from_file.assert_called_once()
 
-    @patch("google.oauth2.credentials.Credentials.from_authorized_user_file")
+    @patch("google.oauth2.credentials.Credentials.from_authorized_user_info")
     @patch("google_auth_oauthlib.flow.InstalledAppFlow")
     def test_refresh_expired_token(self, mock_flow, mock_creds_from_file, mock_config, tmp_path):
         """get_credentials should refresh expired token with refresh_token."""
@@ -98,7 +98,7 @@ class TestGoogleAuthGetCredentials:
         # Verify refresh was attempted
         assert result is not None
 
-    @patch("google_auth_oauthlib.flow.InstalledAppFlow.from_client_secrets_file")
+    @patch("google_auth_oauthlib.flow.InstalledAppFlow.from_client_config")
     def test_run_oauth_flow_if_no_token(self, mock_flow, mock_config, tmp_path):
         """get_credentials should run OAuth flow if no token exists."""
         # Setup
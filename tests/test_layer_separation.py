@@ -51,7 +51,7 @@ class TestServiceFactoryCredentialsBug:
 
         factory = ServiceFactory(auth=mock_auth)
 
-        with patch("gtool.infrastructure.service_factory.discovery.build") as mock_build:
+        with patch("googleapiclient.discovery.build") as mock_build:
             mock_build.return_value = Mock()
             factory.build_service("gmail", "v1")
 
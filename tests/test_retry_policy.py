@@ -80,7 +80,8 @@ def test_retry_policy_exponential_backoff():
             raise ValueError("Retry me")
         return "success"
 
-    policy = RetryPolicy(max_retries=3, delay=0.01)
+    # jitter randomizes waits, so disable it for deterministic timing
+    policy = RetryPolicy(max_retries=3, delay=0.01, jitter=False)
 
     result = policy.execute(track_calls)
 
@@ -93,3 +94,94 @@ def test_retry_policy_exponential_backoff():
         delay2 = call_times[2] - call_times[1]
         # Second delay should be roughly 2x the first (exponential: delay * 2^attempt)
         assert delay2 >= delay1 * 1.5  # Allow some tolerance for system variation
+
+
+def test_retry_policy_execute_async_succeeds_on_retry():
+    """execute_async should retry like execute but sleep via asyncio."""
+    import asyncio
+
+    call_count = 0
+
+    def failing_function():
+        nonlocal call_count
+        call_count += 1
+        if call_count < 3:
+            raise ValueError("Temporary failure")
+        return "success"
+
+    policy = RetryPolicy(max_retries=3, delay=0.001)
+
+    result = asyncio.run(policy.execute_async(failing_function))
+
+    assert result == "success"
+    assert call_count == 3
+
+
+def test_retry_policy_timeout_bounds_retries():
+    """A retry whose backoff would pass the timeout budget raises instead."""
+    call_count = 0
+
+    def always_failing():
+        nonlocal call_count
+        call_count += 1
+        raise ValueError("Still broken")
+
+    # First backoff (1s) already exceeds the 0.01s budget, so there is
+    # exactly one attempt and no sleep.
+    policy = RetryPolicy(max_retries=5, delay=1.0, jitter=False, timeout=0.01)
+
+    start = time.time()
+    with pytest.raises(ValueError):
+        policy.execute(always_failing)
+
+    assert call_count == 1
+    assert time.time() - start < 0.5
+
+
+def test_retry_policy_honors_retry_after_header():
+    """A numeric Retry-After on the error response overrides the backoff."""
+    from unittest.mock import Mock
+
+    from googleapiclient.errors import HttpError
+
+    error = Mock(spec=HttpError)
+    error.resp = Mock()
+    error.resp.status = 429
+    error.resp.get = Mock(return_value="7")
+
+    policy = RetryPolicy(max_retries=3, delay=1.0)
+    assert policy._retry_wait(error, 1) == 7.0
+
+
+def test_retry_policy_retryable_false_calls_once():
+    """retryable=False bypasses the retry loop and raises immediately."""
+    from unittest.mock import Mock
+
+    mock_func = Mock(side_effect=ValueError("boom"))
+
+    policy = RetryPolicy(max_retries=3, delay=0.01)
+    with pytest.raises(ValueError):
+        policy.execute(mock_func, retryable=False)
+    assert mock_func.call_count == 1
+
+
+def test_get_retry_policy_shares_instances_per_config():
+    """Same settings return the same policy; different settings do not."""
+    from gtool.infrastructure.retry import get_retry_policy
+
+    assert get_retry_policy(3, 1.0) is get_retry_policy(3, 1.0)
+    assert get_retry_policy(3, 1.0) is not get_retry_policy(5, 1.0)
+
+
+def test_retry_policy_retryable_false_still_wraps_auth_errors():
+    """The single-attempt path keeps the GoogleAuthError -> AuthError contract."""
+    import google.auth.exceptions
+
+    from gtool.infrastructure.exceptions import AuthError
+
+    def failing_auth():
+        raise google.auth.exceptions.RefreshError("token revoked")
+
+    policy = RetryPolicy(max_retries=3, delay=0.01)
+    with pytest.raises(AuthError):
+        policy.execute(failing_auth, retryable=False)
@@ -215,10 +215,10 @@ def test_scheduler_rejects_invalid_calendar_ids():
 # --- get_free_slots integration test ---
 
 
-def test_get_free_slots_calls_client_for_each_day():
-    """get_free_slots should call client for each day in range."""
+def test_get_free_slots_queries_range_once():
+    """get_free_slots should fetch busy times with one range query."""
     mock_client = Mock()
-    mock_client.get_day_busy_times.return_value = []
+    mock_client.get_range_busy_times.return_value = {"primary": []}
 
     tz = ZoneInfo("America/Los_Angeles")
     search_params = SearchParameters(
@@ -236,7 +236,36 @@ def test_get_free_slots_calls_client_for_each_day():
 
     slots = scheduler.get_free_slots()
 
-    # Should call client 3 times (one per day)
-    assert mock_client.get_day_busy_times.call_count == 3
+    # One freebusy query covers the whole three-day range
+    assert mock_client.get_range_busy_times.call_count == 1
     # Should return 3 full-day slots (no busy times)
     assert len(slots) == 3
+
+
+def test_get_free_slots_reuses_cached_busy_times():
+    """Repeat calls within the TTL reuse the cached freebusy response."""
+    mock_client = Mock()
+    mock_client.get_range_busy_times.return_value = {"primary": []}
+
+    tz = ZoneInfo("America/Los_Angeles")
+    search_params = SearchParameters(
+        start_datetime=datetime.datetime(2025, 5, 2, 0, 0, 0, tzinfo=tz),
+        end_datetime=datetime.datetime(2025, 5, 2, 23, 59, 59, tzinfo=tz),
+        availability_start=datetime.time(8, 0),
+        availability_end=datetime.time(18, 0),
+        duration=30,
+    )
+    scheduler = Scheduler(
+        client=mock_client,
+        search_params=search_params,
+        calendar_ids=["primary"],
+    )
+
+    scheduler.get_free_slots()
+    scheduler.get_free_slots()
+    assert mock_client.get_range_busy_times.call_count == 1
+
+    # Explicit invalidation forces a fresh fetch
+    scheduler.invalidate_cache()
+    scheduler.get_free_slots()
+    assert mock_client.get_range_busy_times.call_count == 2
@@ -11,7 +11,7 @@ from gtool.infrastructure.service_factory import ServiceFactory
 
 def test_service_factory_build_calendar_service(mock_google_auth):
     """FR-003: ServiceFactory should build a working Calendar service."""
-    with patch("gtool.infrastructure.service_factory.discovery.build") as mock_build:
+    with patch("googleapiclient.discovery.build") as mock_build:
         mock_service = MagicMock()
         mock_build.return_value = mock_service
 
@@ -26,7 +26,7 @@ def test_service_factory_build_calendar_service(mock_google_auth):
 
 def test_service_factory_build_gmail_service(mock_google_auth):
     """FR-003: ServiceFactory should build a working Gmail service."""
-    with patch("gtool.infrastructure.service_factory.discovery.build") as mock_build:
+    with patch("googleapiclient.discovery.build") as mock_build:
         mock_service = MagicMock()
         mock_build.return_value = mock_service
 
@@ -41,7 +41,7 @@ def test_service_factory_build_gmail_service(mock_google_auth):
 
 def test_service_factory_handles_different_apis(mock_google_auth):
     """ServiceFactory should handle different API types separately."""
-    with patch("gtool.infrastructure.service_factory.discovery.build") as mock_build:
+    with patch("googleapiclient.discovery.build") as mock_build:
         mock_calendar = MagicMock()
         mock_gmail = MagicMock()
         mock_build.side_effect = [mock_calendar, mock_gmail]
@@ -54,3 +54,18 @@ def test_service_factory_handles_different_apis(mock_google_auth):
         assert calendar_result == mock_calendar
         assert gmail_result == mock_gmail
         assert mock_build.call_count == 2
+
+
+def test_service_factory_build_batch_uses_cached_service(mock_google_auth):
+    """build_batch should create batches from the memoized service."""
+    with patch("googleapiclient.discovery.build") as mock_build:
+        mock_service = MagicMock()
+        mock_build.return_value = mock_service
+
+        factory = ServiceFactory(auth=mock_google_auth)
+        batch = factory.build_batch("gmail", "v1")
+
+        assert batch == mock_service.new_batch_http_request.return_value
+        # A second batch must not rebuild the service
+        factory.build_batch("gmail", "v1")
+        mock_build.assert_called_once()